@@ -10,8 +10,22 @@ Format:
 - Nested sections not supported (flat structure)
 """
 
+import copy
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Parsed file contents keyed by path, stored with the (mtime_ns, size) they were parsed at
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+_TRUE_VALUES = frozenset(('true', 'yes', '1'))
+_FALSE_VALUES = frozenset(('false', 'no', '0'))
+_INT_RE = re.compile(r'[+-]?\d+')
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?')
+
+# One 'key = value' line; comment lines, blank lines, lines without '=' and
+# lines with an empty key never match
+_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
 
 
 def parse_value(value: str) -> Any:
@@ -30,22 +44,17 @@ def parse_value(value: str) -> Any:
         return ''
 
     # Boolean values
-    if value.lower() in ('true', 'yes', '1'):
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if value.lower() in ('false', 'no', '0'):
+    if lowered in _FALSE_VALUES:
         return False
 
-    # Try integer
-    try:
+    # Numbers
+    if _INT_RE.fullmatch(value):
         return int(value)
-    except ValueError:
-        pass
-
-    # Try float
-    try:
+    if _FLOAT_RE.fullmatch(value):
         return float(value)
-    except ValueError:
-        pass
 
     # Check for list (comma-separated values)
     if ',' in value:
@@ -60,6 +69,9 @@ def parse_value(value: str) -> Any:
 def load_config(filepath: str, defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Load configuration from a plain .conf file.
 
+    Parse results are cached per file and reused while its mtime and size
+    are unchanged.
+
     Args:
         filepath: Path to the configuration file
         defaults: Optional dictionary of default values
@@ -69,33 +81,36 @@ def load_config(filepath: str, defaults: Optional[Dict[str, Any]] = None) -> Dic
     """
     config = dict(defaults) if defaults else {}
 
-    if not os.path.exists(filepath):
+    try:
+        st = os.stat(filepath)
+    except OSError:
         return config
 
-    with open(filepath, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            # Strip whitespace
-            line = line.strip()
+    path = os.path.abspath(filepath)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(path)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _parse_file(filepath))
+        _CACHE[path] = cached
 
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
+    # Copy so callers mutating list values don't poison the cache
+    config.update(copy.deepcopy(cached[1]))
+    return config
 
-            # Parse key=value
-            if '=' not in line:
-                continue
 
-            key, _, value = line.partition('=')
-            key = key.strip()
-            value = value.strip()
+def _parse_file(filepath: str) -> Dict[str, Any]:
+    """Parse the key-value pairs of a plain .conf file.
 
-            # Skip empty keys
-            if not key:
-                continue
+    Args:
+        filepath: Path to the configuration file
 
-            config[key] = parse_value(value)
+    Returns:
+        Dictionary with the values found in the file
+    """
+    with open(filepath, 'r') as f:
+        text = f.read()
 
-    return config
+    return {match.group(1): parse_value(match.group(2)) for match in _LINE_RE.finditer(text)}
 
 
 def save_config(filepath: str, config: Dict[str, Any], comments: Optional[Dict[str, str]] = None):
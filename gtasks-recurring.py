@@ -2,21 +2,26 @@
 """
 Google Tasks Recurring Task Manager
 
-Monitors completed Google Tasks for '!every X days' directives and automatically
+Monitors completed Google Tasks for 'every! X days' directives and automatically
 recreates them with updated due dates, implementing repeat-after-completion functionality.
 """
 
 import argparse
+import json
 import logging
 import os
 import re
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 from confparser import load_config, create_default_config
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -66,7 +71,14 @@ class RecurringTaskManager:
     """Manages recurring tasks in Google Tasks based on completion directives."""
 
     SCOPES = ['https://www.googleapis.com/auth/tasks']
-    DIRECTIVE_PATTERN = re.compile(r'every!\s+(\d+)\s+days?', re.IGNORECASE)
+    # Todoist's non-strict recurrence syntax, e.g. 'every! 3 days'
+    DIRECTIVE_MARKER = 'every!'
+    DIRECTIVE_PATTERN = re.compile(r'\bevery!\s+(\d+)\s+days?\b', re.IGNORECASE)
+    # Google caps HTTP batch requests at 100 calls
+    BATCH_SIZE = 100
+    # Upper bound on concurrent per-list fetches
+    MAX_WORKERS = 16
+    RECURRENCE_MODES = ('reuse', 'recreate')
 
     def __init__(self, config_file='gtasks-recurring.conf', dry_run=False):
         """Initialize the recurring task manager.
@@ -78,9 +90,13 @@ class RecurringTaskManager:
         # Resolve paths relative to script directory for cron compatibility
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_file = os.path.join(script_dir, config_file) if not os.path.isabs(config_file) else config_file
+        self.seen_file = os.path.join(script_dir, 'gtasks-recurring-seen.json')
         self.dry_run = dry_run
         self.config = self._load_config()
+        self.seen = self._load_seen()
+        self.creds = None
         self.gtasks = None
+        self._thread_local = threading.local()
         self._init_google_tasks()
 
         if self.dry_run:
@@ -105,13 +121,23 @@ check_interval_minutes = 15
 # Specific task list names to process (comma-separated, empty = all lists)
 # Example: target_lists = My Tasks, Work
 target_lists =
+
+# Only look at tasks completed within this many days
+max_lookback_days = 30
+
+# How to schedule the next occurrence of a completed recurring task:
+#   reuse    - reopen the completed task with the new due date (one API call)
+#   recreate - create a new task and delete the completed one
+recurrence_mode = reuse
 """
 
         defaults = {
             'google_credentials_file': 'credentials.json',
             'google_token_file': 'token.json',
             'check_interval_minutes': 15,
-            'target_lists': []
+            'target_lists': [],
+            'max_lookback_days': 30,
+            'recurrence_mode': 'reuse'
         }
 
         if not os.path.exists(self.config_file):
@@ -129,6 +155,10 @@ target_lists =
             else:
                 config['target_lists'] = []
 
+        if config.get('recurrence_mode') not in self.RECURRENCE_MODES:
+            logging.warning(f"Unknown recurrence_mode '{config.get('recurrence_mode')}', using 'reuse'")
+            config['recurrence_mode'] = 'reuse'
+
         # Resolve credential paths relative to script directory
         script_dir = os.path.dirname(os.path.abspath(__file__))
         for key in ('google_credentials_file', 'google_token_file'):
@@ -137,6 +167,53 @@ target_lists =
 
         return config
 
+    def _completed_min(self) -> str:
+        """Return the RFC 3339 start of the completion lookback window."""
+        lookback = timedelta(days=self.config.get('max_lookback_days', 30))
+        return (datetime.now(timezone.utc) - lookback).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+    def _load_seen(self) -> Dict[str, str]:
+        """Load already processed task IDs with their completion timestamps.
+
+        Entries completed before the lookback window are dropped, since those
+        tasks are no longer fetched.
+
+        Returns:
+            Dictionary mapping task ID -> completion timestamp
+        """
+        if not os.path.exists(self.seen_file):
+            return {}
+
+        try:
+            with open(self.seen_file, 'r') as f:
+                seen = json.load(f)
+        except Exception as e:
+            logging.warning(f"Failed to load processed task state: {e}")
+            return {}
+
+        completed_min = self._completed_min()
+        return {task_id: completed for task_id, completed in seen.items() if completed >= completed_min}
+
+    def _save_seen(self):
+        """Save processed task IDs to file.
+
+        The file is written and fsynced to a temporary file first and swapped
+        in with os.replace, so a crash mid-write never truncates the seen set.
+        """
+        if self.dry_run:
+            return
+
+        tmp_file = self.seen_file + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(self.seen, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.seen_file)
+            logging.debug(f"Saved processed task state to {self.seen_file}")
+        except Exception as e:
+            logging.error(f"Failed to save processed task state: {e}")
+
     def _init_google_tasks(self):
         """Initialize Google Tasks API with OAuth2 authentication."""
         creds = None
@@ -170,9 +247,24 @@ target_lists =
                 token.write(creds.to_json())
                 logging.info(f"Saved credentials to {token_file}")
 
-        self.gtasks = build('tasks', 'v1', credentials=creds)
+        self.creds = creds
+        # Use the discovery document bundled with google-api-python-client
+        # instead of fetching it over HTTPS on every start
+        self.gtasks = build('tasks', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
         logging.info("Google Tasks API initialized successfully")
 
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP client owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so worker threads must not
+        share the HTTP client of the discovery-built service.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
     def get_all_task_lists(self) -> List[Dict]:
         """Retrieve all task lists from Google Tasks.
 
@@ -189,7 +281,7 @@ target_lists =
             return []
 
     def get_completed_tasks(self, list_id: str) -> List[Dict]:
-        """Get all completed tasks from a specific list.
+        """Get tasks completed within the lookback window from a specific list.
 
         Args:
             list_id: The ID of the task list
@@ -197,14 +289,28 @@ target_lists =
         Returns:
             List of completed task dictionaries
         """
-        try:
-            result = self.gtasks.tasks().list(
-                tasklist=list_id,
-                showCompleted=True,
-                showHidden=True
-            ).execute()
+        completed_min = self._completed_min()
 
-            all_tasks = result.get('items', [])
+        try:
+            all_tasks = []
+            page_token = None
+            while True:
+                result = self.gtasks.tasks().list(
+                    tasklist=list_id,
+                    showCompleted=True,
+                    showHidden=True,
+                    completedMin=completed_min,
+                    maxResults=100,
+                    pageToken=page_token
+                ).execute(http=self._thread_http())
+
+                all_tasks.extend(result.get('items', []))
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    break
+
+            # completedMin already filters server-side; keep the status check as a guard
+            # since recreating an active task would delete it
             completed = [t for t in all_tasks if t.get('status') == 'completed']
 
             return completed
@@ -212,21 +318,24 @@ target_lists =
             logging.error(f"Failed to retrieve tasks from list {list_id}: {e}")
             return []
 
-    def parse_directive(self, task: Dict) -> Optional[int]:
-        """Parse the '!every X days' directive from task notes.
+    def parse_directive(self, notes: str) -> Optional[int]:
+        """Parse the 'every! X days' directive from task notes.
 
         Args:
-            task: Google Task dictionary
+            notes: Notes of a Google Task
 
         Returns:
             Number of days, or None if no directive found
         """
-        notes = task.get('notes', '')
+        # Cheap substring test before running the regex over the notes
+        if self.DIRECTIVE_MARKER not in notes.lower():
+            return None
+
         match = self.DIRECTIVE_PATTERN.search(notes)
 
         if match:
             days = int(match.group(1))
-            logging.debug(f"Found directive: !every {days} days in task '{task.get('title')}'")
+            logging.debug(f"Found directive: every! {days} days")
             return days
 
         return None
@@ -241,14 +350,11 @@ target_lists =
         Returns:
             RFC 3339 formatted due date string
         """
-        # Parse completion timestamp
-        completed_dt = datetime.fromisoformat(completed_date.replace('Z', '+00:00'))
-
-        # Calculate new due date
-        new_due_dt = completed_dt + timedelta(days=days_offset)
+        # The new due date is midnight UTC, so only the date part of the timestamp matters
+        new_due = date.fromisoformat(completed_date[:10]) + timedelta(days=days_offset)
 
         # Format as RFC 3339 (Google Tasks format)
-        new_due_str = new_due_dt.strftime('%Y-%m-%dT00:00:00.000Z')
+        new_due_str = f"{new_due.year:04d}-{new_due.month:02d}-{new_due.day:02d}T00:00:00.000Z"
 
         logging.debug(f"Calculated new due date: {new_due_str} (completed: {completed_date}, offset: {days_offset})")
         return new_due_str
@@ -314,6 +420,131 @@ target_lists =
             logging.error(f"Failed to delete task {task_id}: {e}")
             return False
 
+    def _execute_batched(self, requests: List[Tuple[str, object]], callback) -> None:
+        """Execute API requests as HTTP batches of at most BATCH_SIZE calls.
+
+        Args:
+            requests: List of (request_id, HttpRequest) pairs
+            callback: Called as callback(request_id, response, exception) per request
+        """
+        for start in range(0, len(requests), self.BATCH_SIZE):
+            batch = self.gtasks.new_batch_http_request(callback=callback)
+            for request_id, request in requests[start:start + self.BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+
+    def reopen_recurring_tasks(self, list_id: str, recurring: List[Tuple[Dict, str]]) -> List[str]:
+        """Reopen completed recurring tasks in place with their new due date.
+
+        Each task is patched back to 'needsAction' in a single call, sent as
+        HTTP batches, so task IDs stay stable across occurrences.
+
+        Args:
+            list_id: The task list ID
+            recurring: List of (completed task, new RFC 3339 due date) pairs
+
+        Returns:
+            IDs of the recurring tasks reopened
+        """
+        if not recurring:
+            return []
+
+        if self.dry_run:
+            for task, new_due_date in recurring:
+                logging.info(f"[DRY-RUN] Would reopen recurring task: '{task.get('title', 'Untitled')}' (due: {new_due_date})")
+            return [task['id'] for task, _ in recurring]
+
+        tasks_by_id = {task['id']: task for task, _ in recurring}
+        reopened = []
+
+        def on_patch(request_id, response, exception):
+            title = tasks_by_id[request_id].get('title', 'Untitled')
+            if exception is not None:
+                logging.error(f"Failed to reopen recurring task '{title}': {exception}")
+                return
+            logging.info(f"Reopened recurring task: '{title}' (due: {response.get('due')})")
+            reopened.append(request_id)
+
+        patches = []
+        for task, new_due_date in recurring:
+            task_body = {
+                'status': 'needsAction',
+                'completed': None,
+                'due': new_due_date
+            }
+            patches.append((task['id'], self.gtasks.tasks().patch(tasklist=list_id, task=task['id'], body=task_body)))
+
+        try:
+            self._execute_batched(patches, on_patch)
+        except Exception as e:
+            logging.error(f"Failed to execute batch patch for list {list_id}: {e}")
+
+        return reopened
+
+    def recreate_recurring_tasks(self, list_id: str, recurring: List[Tuple[Dict, str]]) -> List[str]:
+        """Create the next occurrence of each recurring task and delete the completed one.
+
+        Inserts are sent as HTTP batches, followed by batched deletes of the
+        completed tasks whose new occurrence was created successfully.
+
+        Args:
+            list_id: The task list ID
+            recurring: List of (completed task, new RFC 3339 due date) pairs
+
+        Returns:
+            IDs of the completed tasks whose next occurrence was created
+        """
+        if not recurring:
+            return []
+
+        if self.dry_run:
+            created = []
+            for task, new_due_date in recurring:
+                if self.create_recurring_task(task, list_id, new_due_date):
+                    created.append(task['id'])
+                    self.delete_task(list_id, task['id'], task.get('title'))
+            return created
+
+        tasks_by_id = {task['id']: task for task, _ in recurring}
+        to_delete = []
+
+        def on_insert(request_id, response, exception):
+            title = tasks_by_id[request_id].get('title', 'Untitled')
+            if exception is not None:
+                logging.error(f"Failed to create recurring task '{title}': {exception}")
+                return
+            logging.info(f"Created recurring task: '{title}' (due: {response.get('due')})")
+            to_delete.append(request_id)
+
+        def on_delete(request_id, response, exception):
+            if exception is not None:
+                logging.error(f"Failed to delete task {request_id}: {exception}")
+            else:
+                logging.debug(f"Deleted task {request_id}")
+
+        inserts = []
+        for task, new_due_date in recurring:
+            task_body = {
+                'title': task.get('title', 'Untitled'),
+                'notes': task.get('notes', ''),
+                'due': new_due_date
+            }
+            inserts.append((task['id'], self.gtasks.tasks().insert(tasklist=list_id, body=task_body)))
+
+        try:
+            self._execute_batched(inserts, on_insert)
+        except Exception as e:
+            logging.error(f"Failed to execute batch insert for list {list_id}: {e}")
+
+        deletes = [(task_id, self.gtasks.tasks().delete(tasklist=list_id, task=task_id))
+                   for task_id in to_delete]
+        try:
+            self._execute_batched(deletes, on_delete)
+        except Exception as e:
+            logging.error(f"Failed to execute batch delete for list {list_id}: {e}")
+
+        return to_delete
+
     def process_recurring_tasks(self):
         """Main processing loop: scan for completed tasks and recreate recurring ones."""
         logging.info("Starting recurring task processing...")
@@ -333,40 +564,63 @@ target_lists =
         total_processed = 0
         total_created = 0
 
-        for task_list in lists_to_process:
-            list_id = task_list['id']
-            list_title = task_list.get('title', 'Untitled')
+        # Fetch completed tasks of all lists concurrently, process them as they arrive
+        max_workers = max(1, min(self.MAX_WORKERS, len(lists_to_process)))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.get_completed_tasks, task_list['id']): task_list for task_list in lists_to_process}
 
-            logging.info(f"Checking list: '{list_title}'")
+            for future in as_completed(futures):
+                task_list = futures[future]
+                list_id = task_list['id']
+                list_title = task_list.get('title', 'Untitled')
 
-            completed_tasks = self.get_completed_tasks(list_id)
-            logging.info(f"Found {len(completed_tasks)} completed task(s)")
+                completed_tasks = future.result()
+                logging.info(f"Checking list: '{list_title}' - found {len(completed_tasks)} completed task(s)")
 
-            for task in completed_tasks:
-                # Check for recurring directive
-                days_offset = self.parse_directive(task)
+                recurring = []
+                for task in completed_tasks:
+                    # Skip tasks already handled in a previous cycle (e.g. when deleting them failed)
+                    if self.seen.get(task['id']) == task.get('completed'):
+                        continue
 
-                if days_offset is None:
-                    continue
+                    # Most tasks have no notes at all, so skip them before parsing
+                    notes = task.get('notes')
+                    if not notes:
+                        continue
 
-                total_processed += 1
+                    # Check for recurring directive
+                    days_offset = self.parse_directive(notes)
 
-                # Get completion timestamp
-                completed_date = task.get('completed')
-                if not completed_date:
-                    logging.warning(f"Completed task '{task.get('title')}' has no completion timestamp, skipping")
-                    continue
+                    if days_offset is None:
+                        continue
 
-                # Calculate new due date
-                new_due_date = self.calculate_new_due_date(completed_date, days_offset)
+                    total_processed += 1
 
-                # Create new recurring task
-                if self.create_recurring_task(task, list_id, new_due_date):
-                    total_created += 1
-                    # Delete the completed task
-                    self.delete_task(list_id, task['id'], task.get('title'))
+                    # Get completion timestamp
+                    completed_date = task.get('completed')
+                    if not completed_date:
+                        logging.warning(f"Completed task '{task.get('title')}' has no completion timestamp, skipping")
+                        continue
+
+                    # Calculate new due date
+                    new_due_date = self.calculate_new_due_date(completed_date, days_offset)
+                    recurring.append((task, new_due_date))
+
+                # Schedule the next occurrence of each recurring task
+                if self.config.get('recurrence_mode') == 'recreate':
+                    scheduled_ids = self.recreate_recurring_tasks(list_id, recurring)
+                else:
+                    scheduled_ids = self.reopen_recurring_tasks(list_id, recurring)
+
+                total_created += len(scheduled_ids)
+                completed_by_id = {task['id']: task['completed'] for task, _ in recurring}
+                for task_id in scheduled_ids:
+                    self.seen[task_id] = completed_by_id[task_id]
+
+        if total_created:
+            self._save_seen()
 
-        logging.info(f"Processing complete. Found {total_processed} recurring task(s), created {total_created} new task(s)")
+        logging.info(f"Processing complete. Found {total_processed} recurring task(s), scheduled {total_created} new occurrence(s)")
 
     def run_once(self):
         """Run a single processing cycle."""
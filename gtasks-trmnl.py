@@ -11,25 +11,75 @@ Tagging method:
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
 import os
+import random
 import re
+import signal
 import sys
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from confparser import load_config, create_default_config
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# orjson is optional: much faster for large mapping files, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Relative paths (config, mappings, credentials) resolve against this for cron compatibility
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Google Tasks API scope
 SCOPES = ['https://www.googleapis.com/auth/tasks']
 
+# Google caps HTTP batch requests at 100 calls
+BATCH_SIZE = 100
+
+# Status codes of batched calls that are retried in later batch passes
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# Number of times a batched call failing with a retryable status is resent
+MAX_RETRIES = 3
+
+# Largest page size accepted by tasks.list and tasklists.list
+PAGE_SIZE = 100
+
+# Threads fetching the remaining pages of long source lists
+MAX_WORKERS = 8
+
+# Partial response masks: only request the fields the sync looks at
+TASK_LIST_FIELDS = 'nextPageToken,items(id,title)'
+TASK_FIELDS = 'nextPageToken,items(id,title,notes,due,status,deleted)'
+# Writes only need the ID of the task back
+WRITE_FIELDS = 'id'
+
+# Version of the mappings file layout written by this script
+MAPPINGS_VERSION = 2
+
+# Incremental scans start this much before the previous scan began
+SCAN_OVERLAP = timedelta(minutes=5)
+
+# The #trmnl tag (case-insensitive); used both to detect and to strip it
+TRMNL_TAG_PATTERN = re.compile(r'#trmnl\b', re.IGNORECASE)
+# Runs of whitespace collapsed to a single space after stripping the tag
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 
 class StdoutFilter(logging.Filter):
     """Filter to allow only INFO and WARNING to stdout."""
@@ -69,6 +119,49 @@ def setup_logging(verbose=False):
     logger.addHandler(stderr_handler)
 
 
+def _json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _is_task_tagged(task: Dict) -> bool:
+    """Check if a task's notes contain the #trmnl tag (case-insensitive).
+
+    A plain function rather than a method so the scan filter calls it
+    without creating a bound method per task.
+    """
+    notes = task.get('notes')
+
+    # Most notes contain no '#' at all; skip the regex search for those
+    if not notes or '#' not in notes:
+        return False
+
+    # Same pattern as stripping, so whatever is detected is also removed
+    return TRMNL_TAG_PATTERN.search(notes) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _strip_trmnl_tag(text: str) -> str:
+    """Remove #trmnl tag from text and clean up whitespace (memoized).
+
+    The same notes are stripped several times per sync (change detection,
+    create/update bodies), so results are cached by input text.
+    """
+    # Remove #trmnl tag (case-insensitive) and clean up whitespace
+    text = TRMNL_TAG_PATTERN.sub('', text)
+    # Clean up any double spaces or leading/trailing whitespace
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
 class TRMNLSyncManager:
     """Manages synchronization of starred tasks to TRMNL list."""
 
@@ -80,13 +173,27 @@ class TRMNLSyncManager:
             dry_run: If True, show what would be done without making changes
         """
         # Resolve paths relative to script directory for cron compatibility
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_file = os.path.join(script_dir, config_file) if not os.path.isabs(config_file) else config_file
-        self.mapping_file = os.path.join(script_dir, 'gtasks-trmnl-mappings.json')
+        self.config_file = os.path.join(SCRIPT_DIR, config_file) if not os.path.isabs(config_file) else config_file
+        self.mapping_file = os.path.join(SCRIPT_DIR, 'gtasks-trmnl-mappings.json')
         self.dry_run = dry_run
         self.config = self._load_config()
+        # Set whenever a mapping changes; unchanged mappings are not rewritten
+        self._mappings_dirty = False
         self.mappings = self._load_mappings()
+        # Hash of the credentials last read from or written to the token file
+        self._token_hash: Optional[str] = None
+        # Per-thread HTTP clients for parallel page fetches
+        self._thread_local = threading.local()
+        # Reverse index trmnl_id -> original_id, kept in memory only
+        self._trmnl_to_original: Dict[str, str] = {}
+        self._rebuild_reverse_index()
         self.gtasks = self._init_google_tasks()
+        # Task lists fetched during the current sync cycle
+        self._lists_cache: Optional[List[Dict]] = None
+        # Set when a source list could not be read in the current scan
+        self._scan_failed = False
+        # Unmapped TRMNL tasks of the current sync cycle keyed by (title, notes)
+        self._trmnl_signature_index: Dict[Tuple[str, str], str] = {}
 
         if self.dry_run:
             logging.info("DRY-RUN MODE: No changes will be made")
@@ -115,6 +222,12 @@ source_lists =
 
 # How often to sync in daemon mode (minutes)
 sync_interval_minutes = 15
+
+# Syncs without changes double the interval, up to this many minutes
+max_sync_interval_minutes = 60
+
+# Between full scans only tasks changed since the previous sync are fetched
+full_sync_interval_hours = 24
 """
 
         defaults = {
@@ -122,7 +235,9 @@ sync_interval_minutes = 15
             'google_token_file': 'token.json',
             'trmnl_list_name': 'TRMNL',
             'source_lists': [],
-            'sync_interval_minutes': 15
+            'sync_interval_minutes': 15,
+            'max_sync_interval_minutes': 60,
+            'full_sync_interval_hours': 24
         }
 
         if not os.path.exists(self.config_file):
@@ -142,10 +257,9 @@ sync_interval_minutes = 15
                 config['source_lists'] = []
 
         # Resolve credential paths relative to script directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
         for key in ('google_credentials_file', 'google_token_file'):
             if config.get(key) and not os.path.isabs(config[key]):
-                config[key] = os.path.join(script_dir, config[key])
+                config[key] = os.path.join(SCRIPT_DIR, config[key])
 
         return config
 
@@ -153,10 +267,12 @@ sync_interval_minutes = 15
         """Load task ID mappings from file."""
         if os.path.exists(self.mapping_file):
             try:
-                with open(self.mapping_file, 'r') as f:
-                    mappings = json.load(f)
-                    logging.info(f"Loaded mappings from {self.mapping_file}")
-                    return mappings
+                with open(self.mapping_file, 'rb') as f:
+                    mappings = _json_loads(f.read())
+                logging.info(f"Loaded mappings from {self.mapping_file}")
+                if mappings.get('version') != MAPPINGS_VERSION:
+                    mappings = self._migrate_mappings(mappings)
+                return mappings
             except Exception as e:
                 logging.error(f"Failed to load mappings file: {e}")
                 return self._create_empty_mappings()
@@ -164,28 +280,110 @@ sync_interval_minutes = 15
             logging.info("No existing mappings file, starting fresh")
             return self._create_empty_mappings()
 
+    def _migrate_mappings(self, mappings: Dict) -> Dict:
+        """Convert version 1 mappings (two mirrored ID dicts) to entries.
+
+        Migrated entries have no signature yet; it is recorded the next time
+        the task is compared with its TRMNL copy.
+        """
+        logging.info("Migrating mappings file to version 2")
+        migrated = self._create_empty_mappings()
+        migrated['entries'] = {
+            original_id: {'trmnl_id': trmnl_id, 'sig': None}
+            for original_id, trmnl_id in mappings.get('original_to_trmnl', {}).items()
+        }
+        migrated['last_sync'] = mappings.get('last_sync')
+        self._mappings_dirty = True
+        return migrated
+
     def _create_empty_mappings(self) -> Dict:
         """Create empty mappings structure."""
         return {
-            "original_to_trmnl": {},
-            "trmnl_to_original": {},
+            "version": MAPPINGS_VERSION,
+            "entries": {},
+            "last_scan": None,
+            "last_full_scan": None,
             "last_sync": None
         }
 
     def _save_mappings(self):
-        """Save task ID mappings to file."""
+        """Save task ID mappings to file if they changed.
+
+        The file is written and fsynced to a temporary file first and swapped
+        in with os.replace, so a crash mid-write never leaves a truncated file.
+        """
         if self.dry_run:
             logging.info(f"[DRY-RUN] Would save mappings to {self.mapping_file}")
             return
 
+        self.mappings["last_sync"] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+        if not self._mappings_dirty:
+            logging.debug("Mappings unchanged, not saving")
+            return
+
+        tmp_file = self.mapping_file + '.tmp'
         try:
-            self.mappings["last_sync"] = datetime.now(timezone.utc).isoformat()
-            with open(self.mapping_file, 'w') as f:
-                json.dump(self.mappings, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self.mappings))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.mapping_file)
+            self._mappings_dirty = False
             logging.info(f"Saved mappings to {self.mapping_file}")
         except Exception as e:
             logging.error(f"Failed to save mappings: {e}")
 
+    @staticmethod
+    def _credentials_hash(creds: Credentials) -> str:
+        """Return a hash of the serialized credentials."""
+        return hashlib.sha256(creds.to_json().encode('utf-8')).hexdigest()
+
+    def _save_token(self, creds: Credentials):
+        """Write credentials to the token file if they changed.
+
+        The token is written to a temporary file of this process and swapped
+        in with os.replace, so other instances sharing the token file never
+        read a partial token.
+        """
+        token_hash = self._credentials_hash(creds)
+        if token_hash == self._token_hash:
+            return
+
+        token_file = self.config.get('google_token_file', 'token.json')
+        tmp_file = f"{token_file}.{os.getpid()}.tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(creds.to_json())
+            token.flush()
+            os.fsync(token.fileno())
+        os.replace(tmp_file, token_file)
+        self._token_hash = token_hash
+        logging.info(f"Saved credentials to {token_file}")
+
+    def _refresh_credentials(self):
+        """Refresh expired credentials and persist tokens refreshed in memory.
+
+        The API client refreshes access tokens by itself but never writes them
+        back, so a long-running daemon checks before each cycle.
+        """
+        if self.creds.expired and self.creds.refresh_token:
+            logging.info("Refreshing expired Google credentials")
+            self.creds.refresh(Request())
+        self._save_token(self.creds)
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP client owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so worker threads must not
+        share the HTTP client of the discovery-built service.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
     def _init_google_tasks(self):
         """Initialize Google Tasks API client."""
         creds = None
@@ -195,6 +393,7 @@ sync_interval_minutes = 15
         # Load existing credentials
         if os.path.exists(token_file):
             creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+            self._token_hash = self._credentials_hash(creds)
 
         # Refresh or get new credentials
         if not creds or not creds.valid:
@@ -212,43 +411,147 @@ sync_interval_minutes = 15
                 flow = InstalledAppFlow.from_client_secrets_file(creds_file, SCOPES)
                 creds = flow.run_local_server(port=0)
 
-            # Save credentials
-            with open(token_file, 'w') as token:
-                token.write(creds.to_json())
-            logging.info(f"Saved credentials to {token_file}")
+            self._save_token(creds)
+
+        self.creds = creds
+
+        # Use the discovery document bundled with google-api-python-client
+        # instead of fetching it over HTTPS on every start
+        return build('tasks', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
 
-        return build('tasks', 'v1', credentials=creds)
+    def _run_batches(self, requests: List[Tuple[str, object]], callback):
+        """Execute API requests as HTTP batches of at most BATCH_SIZE calls.
+
+        Args:
+            requests: List of (request_id, HttpRequest) pairs
+            callback: Called as callback(request_id, response, exception) per request
+        """
+        for start in range(0, len(requests), BATCH_SIZE):
+            batch = self.gtasks.new_batch_http_request(callback=callback)
+            for request_id, request in requests[start:start + BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
+
+    def _execute_batched(self, requests: List[Tuple[str, object]], callback):
+        """Execute API requests in batches, retrying transient failures.
+
+        Requests failing with a rate-limit or server error are resent up to
+        MAX_RETRIES times before being reported to the callback. Each retry
+        pass waits as long as the largest Retry-After header asks, or
+        otherwise min(60, 2 ** attempt) seconds plus jitter.
+
+        Args:
+            requests: List of (request_id, HttpRequest) pairs
+            callback: Called as callback(request_id, response, exception) per request
+        """
+        requests_by_id = dict(requests)
+        retry_ids = []
+        retry_after = []
+        final_attempt = False
+
+        def collect(request_id, response, exception):
+            if (not final_attempt and isinstance(exception, HttpError)
+                    and exception.resp.status in RETRYABLE_STATUSES):
+                retry_ids.append(request_id)
+                try:
+                    retry_after.append(float(exception.resp.get('retry-after')))
+                except (TypeError, ValueError):
+                    pass
+            else:
+                callback(request_id, response, exception)
+
+        to_send = requests
+        for attempt in range(MAX_RETRIES + 1):
+            final_attempt = attempt == MAX_RETRIES
+            retry_ids.clear()
+            retry_after.clear()
+            self._run_batches(to_send, collect)
+            if not retry_ids:
+                break
+
+            delay = max(retry_after) if retry_after else min(60, 2 ** attempt) + random.uniform(0, 1)
+            logging.warning(f"Retrying {len(retry_ids)} failed request(s) in {delay:.0f} seconds")
+            time.sleep(delay)
+            to_send = [(request_id, requests_by_id[request_id]) for request_id in retry_ids]
 
     def get_all_task_lists(self) -> List[Dict]:
-        """Retrieve all task lists from Google Tasks."""
+        """Retrieve all task lists from Google Tasks.
+
+        The result is cached until the next sync cycle starts.
+        """
+        if self._lists_cache is not None:
+            return self._lists_cache
+
         try:
-            results = self.gtasks.tasklists().list().execute()
-            lists = results.get('items', [])
+            lists = []
+            page_token = None
+            while True:
+                results = self.gtasks.tasklists().list(
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=TASK_LIST_FIELDS
+                ).execute()
+                lists.extend(results.get('items', []))
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
             logging.info(f"Found {len(lists)} task list(s)")
+            self._lists_cache = lists
             return lists
         except Exception as e:
             logging.error(f"Failed to retrieve task lists: {e}")
             return []
 
-    def get_tasks_in_list(self, list_id: str, include_completed: bool = False) -> List[Dict]:
-        """Get tasks from a specific list.
+    @staticmethod
+    def _list_filter(include_completed: bool = False, updated_min: Optional[str] = None) -> Dict:
+        """Build the filter parameters of a tasks.list call.
+
+        Args:
+            include_completed: Whether to include completed tasks
+            updated_min: Only return tasks updated since this RFC 3339 timestamp,
+                including completed and deleted ones
+
+        Returns:
+            Keyword arguments for tasks().list()
+        """
+        if updated_min:
+            return {'showCompleted': True, 'showHidden': True, 'showDeleted': True, 'updatedMin': updated_min}
+        return {'showCompleted': include_completed, 'showHidden': include_completed, 'showDeleted': False}
+
+    def get_tasks_in_list(self, list_id: str, include_completed: bool = False,
+                          page_token: Optional[str] = None, updated_min: Optional[str] = None,
+                          http: Optional[google_auth_httplib2.AuthorizedHttp] = None) -> List[Dict]:
+        """Get tasks from a specific list, following pagination.
 
         Args:
             list_id: The task list ID
             include_completed: Whether to include completed tasks
+            page_token: Page to start from (default: first page)
+            updated_min: Only return tasks updated since this RFC 3339 timestamp,
+                including completed and deleted ones
+            http: HTTP client to use (default: the service's own client)
 
         Returns:
             List of task dictionaries
         """
         try:
-            result = self.gtasks.tasks().list(
-                tasklist=list_id,
-                showCompleted=include_completed,
-                showHidden=include_completed
-            ).execute()
-            return result.get('items', [])
+            tasks = []
+            while True:
+                result = self.gtasks.tasks().list(
+                    tasklist=list_id,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=TASK_FIELDS,
+                    **self._list_filter(include_completed, updated_min)
+                ).execute(http=http)
+                tasks.extend(result.get('items', []))
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    return tasks
         except Exception as e:
             logging.error(f"Failed to retrieve tasks from list {list_id}: {e}")
+            self._scan_failed = True
             return []
 
     def is_task_tagged(self, task: Dict) -> bool:
@@ -260,10 +563,7 @@ sync_interval_minutes = 15
         Returns:
             True if task has #trmnl tag in notes (case-insensitive)
         """
-        notes = task.get('notes', '')
-
-        # Check for #trmnl tag (case-insensitive)
-        return '#trmnl' in notes.lower()
+        return _is_task_tagged(task)
 
     def strip_trmnl_tag(self, text: str) -> str:
         """Remove #trmnl tag from text for clean TRMNL display.
@@ -274,11 +574,7 @@ sync_interval_minutes = 15
         Returns:
             Text with #trmnl tag removed, whitespace cleaned
         """
-        # Remove #trmnl tag (case-insensitive) and clean up whitespace
-        text = re.sub(r'#trmnl\b', '', text, flags=re.IGNORECASE)
-        # Clean up any double spaces or leading/trailing whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return _strip_trmnl_tag(text)
 
     def get_trmnl_list_id(self) -> Optional[str]:
         """Find the TRMNL list ID.
@@ -298,6 +594,95 @@ sync_interval_minutes = 15
         logging.error(f"TRMNL list '{trmnl_list_name}' not found. Please create it first.")
         return None
 
+    def _trmnl_task_body(self, original_task: Dict) -> Dict:
+        """Build the TRMNL copy of a task: same title, notes without #trmnl tag.
+
+        Args:
+            original_task: Original task with #trmnl tag
+
+        Returns:
+            Task body for the Google Tasks API
+        """
+        return {
+            'title': original_task.get('title', ''),
+            'notes': self.strip_trmnl_tag(original_task.get('notes', ''))
+        }
+
+    @staticmethod
+    def _trmnl_signature(task: Dict) -> Tuple[str, str]:
+        """Return the (title, notes) signature of a TRMNL task or task body."""
+        return (task.get('title', ''), task.get('notes', ''))
+
+    @classmethod
+    def _signature_hash(cls, task: Dict) -> str:
+        """Return a stable 64-bit hash of a task's (title, notes) signature.
+
+        Stored in the mappings file, so it must not depend on Python's
+        per-process string hash seed.
+        """
+        title, notes = cls._trmnl_signature(task)
+        data = f"{title}\x00{notes}".encode('utf-8')
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def _build_signature_index(self, trmnl_tasks: Dict[str, Dict]) -> Dict[Tuple[str, str], str]:
+        """Index active TRMNL tasks that are not mapped to any original by content.
+
+        Args:
+            trmnl_tasks: Dictionary mapping trmnl_id -> task
+
+        Returns:
+            Dictionary mapping (title, notes) -> trmnl_id
+        """
+        trmnl_to_original = self._trmnl_to_original
+        return {
+            self._trmnl_signature(task): trmnl_id
+            for trmnl_id, task in trmnl_tasks.items()
+            if trmnl_id not in trmnl_to_original and task.get('status') != 'completed'
+        }
+
+    def _rebuild_reverse_index(self):
+        """Rebuild the trmnl_id -> original_id index from the mapping entries."""
+        self._trmnl_to_original = {
+            entry['trmnl_id']: original_id
+            for original_id, entry in self.mappings['entries'].items()
+        }
+
+    def _map_trmnl_task(self, original_id: str, trmnl_id: str, sig: Optional[str]):
+        """Record the mapping between an original task and its TRMNL copy.
+
+        The reverse entry of a previous copy is left in place until the index
+        is rebuilt, so cleanup still treats that copy as mapped and stale.
+
+        Args:
+            original_id: Original task ID
+            trmnl_id: TRMNL task ID
+            sig: Signature hash of the TRMNL copy's title and notes
+        """
+        self.mappings['entries'][original_id] = {'trmnl_id': trmnl_id, 'sig': sig}
+        self._trmnl_to_original[trmnl_id] = original_id
+        self._mappings_dirty = True
+
+    def _map_duplicates(self, duplicates: List[Tuple[str, str]]):
+        """Point duplicate originals at the TRMNL copy of their first occurrence.
+
+        Args:
+            duplicates: (duplicate original_id, first original_id) pairs
+        """
+        entries = self.mappings['entries']
+        for original_id, first_id in duplicates:
+            first_entry = entries.get(first_id)
+            if first_entry is None or entries.get(original_id) == first_entry:
+                continue
+            entries[original_id] = dict(first_entry)
+            self._mappings_dirty = True
+
+    def _set_signature(self, original_id: str, sig: str):
+        """Record the signature hash last written to an original's TRMNL copy."""
+        entry = self.mappings['entries'].get(original_id)
+        if entry is not None and entry.get('sig') != sig:
+            entry['sig'] = sig
+            self._mappings_dirty = True
+
     def task_needs_update(self, original: Dict, trmnl: Dict) -> bool:
         """Check if TRMNL task needs to be updated based on original.
 
@@ -327,122 +712,209 @@ sync_interval_minutes = 15
 
         return False
 
-    def create_trmnl_task(self, original_task: Dict, original_list_id: str, trmnl_list_id: str) -> Optional[str]:
-        """Create a new task in TRMNL list (duplicate of original without #trmnl tag).
+    def create_trmnl_tasks(self, original_tasks: List[Dict], trmnl_list_id: str) -> int:
+        """Create TRMNL tasks (duplicates of the originals without #trmnl tag).
+
+        An unmapped TRMNL task with identical title and notes (e.g. left behind
+        by an interrupted run) is adopted instead of inserting a duplicate.
+        Inserts are sent as HTTP batches; mappings are updated for every
+        task created successfully.
 
         Args:
-            original_task: Original task to duplicate
-            original_list_id: Original task's list ID
+            original_tasks: Original tasks to duplicate
             trmnl_list_id: TRMNL list ID
 
         Returns:
-            Created task ID or None on failure
+            Number of TRMNL tasks created
         """
-        original_id = original_task['id']
-        clean_title = original_task.get('title', '')
-        clean_notes = self.strip_trmnl_tag(original_task.get('notes', ''))
+        remaining = []
+        for task in original_tasks:
+            task_body = self._trmnl_task_body(task)
+            trmnl_id = self._trmnl_signature_index.pop(self._trmnl_signature(task_body), None)
+            if trmnl_id is None:
+                remaining.append(task)
+            elif self.dry_run:
+                logging.info(f"[DRY-RUN] Would adopt existing TRMNL task: '{task.get('title', '')}' (ID: {trmnl_id})")
+            else:
+                logging.info(f"Adopted existing TRMNL task: '{task.get('title', '')}' (ID: {trmnl_id})")
+                self._map_trmnl_task(task['id'], trmnl_id, self._signature_hash(task_body))
+        original_tasks = remaining
 
-        task_body = {
-            'title': clean_title,
-            'notes': clean_notes
-        }
-
-        # Note: Due dates are intentionally NOT synced to TRMNL list
-        # to avoid duplicate calendar entries
+        if not original_tasks:
+            return 0
 
         if self.dry_run:
-            logging.info(f"[DRY-RUN] Would create TRMNL task: '{clean_title}'")
-            return f"dry_run_{original_id}"
+            for original_task in original_tasks:
+                logging.info(f"[DRY-RUN] Would create TRMNL task: '{original_task.get('title', '')}'")
+            return len(original_tasks)
 
-        try:
-            created_task = self.gtasks.tasks().insert(
-                tasklist=trmnl_list_id,
-                body=task_body
-            ).execute()
+        originals_by_id = {task['id']: task for task in original_tasks}
+        bodies_by_id = {task['id']: self._trmnl_task_body(task) for task in original_tasks}
+        created = []
+
+        def on_insert(original_id, response, exception):
+            clean_title = originals_by_id[original_id].get('title', '')
+            if exception is not None:
+                logging.error(f"Failed to create TRMNL task '{clean_title}': {exception}")
+                return
 
-            trmnl_id = created_task['id']
+            trmnl_id = response['id']
             logging.info(f"Created TRMNL task: '{clean_title}' (ID: {trmnl_id})")
 
-            # Update mappings
-            self.mappings['original_to_trmnl'][original_id] = trmnl_id
-            self.mappings['trmnl_to_original'][trmnl_id] = original_id
+            self._map_trmnl_task(original_id, trmnl_id, self._signature_hash(bodies_by_id[original_id]))
+            created.append(trmnl_id)
 
-            return trmnl_id
+        # Note: Due dates are intentionally NOT synced to TRMNL list
+        # to avoid duplicate calendar entries
+        requests = [
+            (task['id'], self.gtasks.tasks().insert(
+                tasklist=trmnl_list_id,
+                body=bodies_by_id[task['id']],
+                fields=WRITE_FIELDS
+            ))
+            for task in original_tasks
+        ]
+        try:
+            self._execute_batched(requests, on_insert)
         except Exception as e:
-            logging.error(f"Failed to create TRMNL task '{clean_title}': {e}")
-            return None
+            logging.error(f"Failed to create TRMNL tasks: {e}")
 
-    def update_trmnl_task(self, original_task: Dict, trmnl_task: Dict, trmnl_list_id: str) -> bool:
-        """Update existing TRMNL task with changes from original.
+        return len(created)
+
+    def update_trmnl_tasks(self, pairs: List[Tuple[Dict, Dict]], trmnl_list_id: str) -> int:
+        """Update existing TRMNL tasks with changes from their originals.
 
         Args:
-            original_task: Original task with updates
-            trmnl_task: Current TRMNL task to update
+            pairs: List of (original task with updates, current TRMNL task) pairs
             trmnl_list_id: TRMNL list ID
 
         Returns:
-            True if update successful
+            Number of TRMNL tasks updated
         """
-        clean_title = original_task.get('title', '')
-        clean_notes = self.strip_trmnl_tag(original_task.get('notes', ''))
-
-        task_body = {
-            'id': trmnl_task['id'],
-            'title': clean_title,
-            'notes': clean_notes
-        }
-
-        # Note: Due dates are intentionally NOT synced to TRMNL list
-        # to avoid duplicate calendar entries
+        if not pairs:
+            return 0
 
         if self.dry_run:
-            logging.info(f"[DRY-RUN] Would update TRMNL task: '{clean_title}'")
-            return True
-
-        try:
-            self.gtasks.tasks().update(
+            for original_task, _ in pairs:
+                logging.info(f"[DRY-RUN] Would update TRMNL task: '{original_task.get('title', '')}'")
+            return len(pairs)
+
+        titles_by_id = {trmnl_task['id']: original_task.get('title', '') for original_task, trmnl_task in pairs}
+        sigs_by_id = {}
+        # The reverse index may name another original sharing the copy
+        originals_by_id = {trmnl_task['id']: original_task['id'] for original_task, trmnl_task in pairs}
+        updated = []
+
+        def on_update(trmnl_id, response, exception):
+            if exception is not None:
+                logging.error(f"Failed to update TRMNL task '{titles_by_id[trmnl_id]}': {exception}")
+                return
+            logging.info(f"Updated TRMNL task: '{titles_by_id[trmnl_id]}'")
+            self._set_signature(originals_by_id[trmnl_id], sigs_by_id[trmnl_id])
+            updated.append(trmnl_id)
+
+        requests = []
+        for original_task, trmnl_task in pairs:
+            task_body = self._trmnl_task_body(original_task)
+            sigs_by_id[trmnl_task['id']] = self._signature_hash(task_body)
+            task_body['id'] = trmnl_task['id']
+            requests.append((trmnl_task['id'], self.gtasks.tasks().update(
                 tasklist=trmnl_list_id,
                 task=trmnl_task['id'],
-                body=task_body
-            ).execute()
-
-            logging.info(f"Updated TRMNL task: '{clean_title}'")
-            return True
+                body=task_body,
+                fields=WRITE_FIELDS
+            )))
+        try:
+            self._execute_batched(requests, on_update)
         except Exception as e:
-            logging.error(f"Failed to update TRMNL task '{clean_title}': {e}")
-            return False
+            logging.error(f"Failed to update TRMNL tasks: {e}")
 
-    def delete_trmnl_task(self, trmnl_task_id: str, trmnl_list_id: str):
-        """Delete a task from TRMNL list and clean up mappings.
+        return len(updated)
+
+    def delete_trmnl_tasks(self, trmnl_task_ids: List[str], trmnl_list_id: str) -> int:
+        """Delete tasks from TRMNL list and clean up mappings.
 
         Args:
-            trmnl_task_id: TRMNL task ID to delete
+            trmnl_task_ids: TRMNL task IDs to delete
             trmnl_list_id: TRMNL list ID
+
+        Returns:
+            Number of TRMNL tasks deleted
         """
+        if not trmnl_task_ids:
+            return 0
+
         if self.dry_run:
-            logging.info(f"[DRY-RUN] Would delete TRMNL task ID: {trmnl_task_id}")
-            return
+            for trmnl_task_id in trmnl_task_ids:
+                logging.info(f"[DRY-RUN] Would delete TRMNL task ID: {trmnl_task_id}")
+            return len(trmnl_task_ids)
 
-        try:
-            self.gtasks.tasks().delete(
-                tasklist=trmnl_list_id,
-                task=trmnl_task_id
-            ).execute()
+        deleted = []
+
+        def on_delete(trmnl_task_id, response, exception):
+            if exception is not None:
+                logging.error(f"Failed to delete TRMNL task {trmnl_task_id}: {exception}")
+                return
 
             logging.info(f"Deleted TRMNL task ID: {trmnl_task_id}")
+            self._trmnl_to_original.pop(trmnl_task_id, None)
+            deleted.append(trmnl_task_id)
 
-            # Clean up mappings
-            original_id = self.mappings['trmnl_to_original'].pop(trmnl_task_id, None)
-            if original_id:
-                self.mappings['original_to_trmnl'].pop(original_id, None)
+        requests = [
+            (trmnl_task_id, self.gtasks.tasks().delete(tasklist=trmnl_list_id, task=trmnl_task_id))
+            for trmnl_task_id in trmnl_task_ids
+        ]
+        try:
+            self._execute_batched(requests, on_delete)
         except Exception as e:
-            logging.error(f"Failed to delete TRMNL task {trmnl_task_id}: {e}")
+            logging.error(f"Failed to delete TRMNL tasks: {e}")
 
-    def get_all_tagged_tasks(self) -> Dict[str, List[Dict]]:
-        """Scan all source lists for tasks tagged with #trmnl.
+        # Clean up mappings, including every duplicate original sharing a deleted copy
+        deleted_ids = set(deleted)
+        entries = self.mappings['entries']
+        stale_ids = [original_id for original_id, entry in entries.items() if entry['trmnl_id'] in deleted_ids]
+        for original_id in stale_ids:
+            del entries[original_id]
+        if stale_ids:
+            self._mappings_dirty = True
+
+        return len(deleted)
+
+    def _fetch_all_trmnl_tasks(self, trmnl_list_id: str) -> Optional[Dict[str, Dict]]:
+        """Fetch every task of the TRMNL list, following pagination.
+
+        Args:
+            trmnl_list_id: TRMNL list ID
 
         Returns:
-            Dictionary mapping list_id -> list of tagged tasks
+            Dictionary mapping trmnl_id -> task, including completed tasks,
+            or None if the list could not be read
+        """
+        scan_failed = self._scan_failed
+        self._scan_failed = False
+        trmnl_tasks = self.get_tasks_in_list(trmnl_list_id, include_completed=True)
+        fetch_failed = self._scan_failed
+        self._scan_failed = scan_failed or fetch_failed
+        if fetch_failed:
+            return None
+        return {task['id']: task for task in trmnl_tasks}
+
+    def _scan_source_lists(self, keep: Callable[[Dict], bool],
+                           updated_min: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Fetch tasks from all source lists, keeping those matching a filter.
+
+        Fetches the first page of every list in batched requests and remaining
+        pages of long lists one by one. Pages are filtered as they arrive so
+        irrelevant tasks are not kept around. Sets self._scan_failed if any
+        list could not be read.
+
+        Args:
+            keep: Predicate deciding which tasks to return
+            updated_min: Only fetch tasks updated since this RFC 3339 timestamp,
+                including completed and deleted ones (default: active tasks only)
+
+        Returns:
+            Dictionary mapping list_id -> kept tasks (lists without any omitted)
         """
         all_lists = self.get_all_task_lists()
         source_lists = self.config.get('source_lists', [])
@@ -458,128 +930,308 @@ sync_interval_minutes = 15
             lists_to_scan = [l for l in all_lists if l.get('title') != trmnl_list_name]
             logging.info(f"Scanning all {len(lists_to_scan)} list(s) (excluding TRMNL)")
 
+        kept_by_list = {}
+        next_page_tokens = {}
+        self._scan_failed = False
+
+        def on_list(list_id, response, exception):
+            if exception is not None:
+                logging.error(f"Failed to retrieve tasks from list {list_id}: {exception}")
+                self._scan_failed = True
+                return
+            kept_by_list[list_id] = list(filter(keep, response.get('items', ())))
+            if response.get('nextPageToken'):
+                next_page_tokens[list_id] = response['nextPageToken']
+
+        requests = [
+            (task_list['id'], self.gtasks.tasks().list(
+                tasklist=task_list['id'],
+                maxResults=PAGE_SIZE,
+                fields=TASK_FIELDS,
+                **self._list_filter(updated_min=updated_min)
+            ))
+            for task_list in lists_to_scan
+        ]
+        try:
+            self._execute_batched(requests, on_list)
+        except Exception as e:
+            logging.error(f"Failed to retrieve tasks from source lists: {e}")
+            self._scan_failed = True
+
+        # Long lists page sequentially, but separate lists can page in parallel
+        def fetch_remaining(list_id):
+            remaining = self.get_tasks_in_list(list_id, page_token=next_page_tokens[list_id],
+                                               updated_min=updated_min, http=self._thread_http())
+            return list_id, list(filter(keep, remaining))
+
+        if len(next_page_tokens) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(next_page_tokens))) as executor:
+                for list_id, kept in executor.map(fetch_remaining, next_page_tokens):
+                    kept_by_list[list_id].extend(kept)
+        elif next_page_tokens:
+            list_id, page_token = next(iter(next_page_tokens.items()))
+            remaining = self.get_tasks_in_list(list_id, page_token=page_token, updated_min=updated_min)
+            kept_by_list[list_id].extend(filter(keep, remaining))
+
+        titles = {task_list['id']: task_list.get('title', 'Untitled') for task_list in lists_to_scan}
+        result = {}
+        for list_id, tasks in kept_by_list.items():
+            if tasks:
+                result[list_id] = tasks
+                logging.info(f"  '{titles[list_id]}': {len(tasks)} task(s)")
+        return result
+
+    def get_all_tagged_tasks(self) -> Dict[str, List[Dict]]:
+        """Scan all source lists for tasks tagged with #trmnl.
+
+        Returns:
+            Dictionary mapping list_id -> list of tagged tasks
+        """
+        tagged_tasks_by_list = self._scan_source_lists(_is_task_tagged)
+        total_tagged = sum(len(tasks) for tasks in tagged_tasks_by_list.values())
+        logging.info(f"Total tagged tasks found: {total_tagged}")
+        return tagged_tasks_by_list
+
+    def get_changed_tasks(self, updated_min: str) -> Tuple[Dict[str, List[Dict]], set]:
+        """Scan source lists for relevant tasks changed since a timestamp.
+
+        Args:
+            updated_min: RFC 3339 timestamp of the previous scan
+
+        Returns:
+            Tuple of (list_id -> changed active tagged tasks, set of mapped
+            original IDs that were untagged, completed or deleted)
+        """
+        entries = self.mappings['entries']
+        changed_by_list = self._scan_source_lists(
+            lambda task: task['id'] in entries or _is_task_tagged(task),
+            updated_min=updated_min
+        )
+
         tagged_tasks_by_list = {}
-        total_tagged = 0
+        gone_ids = set()
+        for list_id, tasks in changed_by_list.items():
+            for task in tasks:
+                if task.get('deleted') or task.get('status') == 'completed' or not self.is_task_tagged(task):
+                    gone_ids.add(task['id'])
+                else:
+                    tagged_tasks_by_list.setdefault(list_id, []).append(task)
 
-        for task_list in lists_to_scan:
-            list_id = task_list['id']
-            list_title = task_list.get('title', 'Untitled')
+        changed_count = sum(len(tasks) for tasks in tagged_tasks_by_list.values())
+        logging.info(f"Changed tagged tasks: {changed_count}, no longer tagged: {len(gone_ids)}")
+        return tagged_tasks_by_list, gone_ids
 
-            # Get active tasks only (not completed)
-            tasks = self.get_tasks_in_list(list_id, include_completed=False)
-            tagged_tasks = [t for t in tasks if self.is_task_tagged(t)]
+    def _full_scan_due(self, now: datetime) -> bool:
+        """Check whether this cycle must scan all source lists.
 
-            if tagged_tasks:
-                tagged_tasks_by_list[list_id] = tagged_tasks
-                total_tagged += len(tagged_tasks)
-                logging.info(f"  '{list_title}': {len(tagged_tasks)} tagged task(s)")
+        Incremental scans only see tasks whose 'updated' timestamp moved, so
+        a full scan runs periodically to catch anything they missed.
+        """
+        if not self.mappings.get('last_scan') or not self.mappings.get('last_full_scan'):
+            return True
+        interval = timedelta(hours=self.config.get('full_sync_interval_hours', 24))
+        return now - datetime.fromisoformat(self.mappings['last_full_scan']) >= interval
 
-        logging.info(f"Total tagged tasks found: {total_tagged}")
-        return tagged_tasks_by_list
+    def sync_tagged_tasks(self, full_scan: bool = False) -> int:
+        """Main sync logic: sync all #trmnl tagged tasks to TRMNL list.
+
+        Between full scans only tasks updated since the previous scan are
+        fetched from the source lists (Tasks API updatedMin).
+
+        Args:
+            full_scan: Scan all source lists even if an incremental scan would do
 
-    def sync_tagged_tasks(self):
-        """Main sync logic: sync all #trmnl tagged tasks to TRMNL list."""
+        Returns:
+            Number of TRMNL tasks created, updated or deleted
+        """
         logging.info("Starting tagged tasks sync...")
+        scan_started = datetime.now(timezone.utc)
+
+        # Refresh the task lists once per cycle
+        self._lists_cache = None
+        self._rebuild_reverse_index()
 
         # Get TRMNL list ID
         trmnl_list_id = self.get_trmnl_list_id()
         if not trmnl_list_id:
             logging.error("Cannot proceed without TRMNL list")
-            return
+            return 0
+
+        entries = self.mappings['entries']
+        full_scan = full_scan or self._full_scan_due(scan_started)
 
-        # Get all tagged tasks
-        tagged_tasks_by_list = self.get_all_tagged_tasks()
+        # Get tagged tasks: all of them, or only those changed since the last scan
+        if full_scan:
+            logging.info("Full scan of source lists")
+            tagged_tasks_by_list = self.get_all_tagged_tasks()
+            unchanged_ids = []
+        else:
+            logging.info(f"Incremental scan of tasks updated since {self.mappings['last_scan']}")
+            tagged_tasks_by_list, gone_ids = self.get_changed_tasks(self.mappings['last_scan'])
+            changed_ids = gone_ids.union(
+                task['id'] for tasks in tagged_tasks_by_list.values() for task in tasks
+            )
+            # Mapped originals not returned by the scan are still tagged and unchanged
+            unchanged_ids = [original_id for original_id in entries if original_id not in changed_ids]
+
+        # Fetch the TRMNL list once; used for existence and update checks and for cleanup
+        trmnl_tasks = self._fetch_all_trmnl_tasks(trmnl_list_id)
+        if trmnl_tasks is None:
+            # Every mapped copy would look missing and be recreated
+            logging.error("Cannot read TRMNL list, skipping this sync")
+            return 0
+        self._trmnl_signature_index = self._build_signature_index(trmnl_tasks)
 
         # Track which original task IDs we've seen (to detect deletions later)
-        seen_original_ids = set()
+        seen_original_ids = set(unchanged_ids)
 
-        # Process each tagged task
-        created_count = 0
-        updated_count = 0
+        # First task seen with each signature; later copies share its TRMNL task
+        first_by_sig: Dict[str, str] = {}
+        duplicates = []
+        # TRMNL tasks already backing an original processed in this cycle
+        claimed_trmnl_ids = set()
+
+        for original_id in unchanged_ids:
+            entry = entries[original_id]
+            claimed_trmnl_ids.add(entry['trmnl_id'])
+            if entry.get('sig'):
+                first_by_sig.setdefault(entry['sig'], original_id)
+
+        to_create = []
+        to_update = []
 
         for list_id, tagged_tasks in tagged_tasks_by_list.items():
             for task in tagged_tasks:
                 original_id = task['id']
                 seen_original_ids.add(original_id)
 
+                sig = self._signature_hash(self._trmnl_task_body(task))
+                if sig in first_by_sig:
+                    logging.debug(f"Duplicate of another tagged task: '{task.get('title', '')}'")
+                    duplicates.append((original_id, first_by_sig[sig]))
+                    continue
+                first_by_sig[sig] = original_id
+
                 # Check if already mapped
-                if original_id in self.mappings['original_to_trmnl']:
-                    trmnl_id = self.mappings['original_to_trmnl'][original_id]
-
-                    # Get current TRMNL task to check for updates
-                    try:
-                        trmnl_task = self.gtasks.tasks().get(
-                            tasklist=trmnl_list_id,
-                            task=trmnl_id
-                        ).execute()
-
-                        # Update if needed
-                        if self.task_needs_update(task, trmnl_task):
-                            if self.update_trmnl_task(task, trmnl_task, trmnl_list_id):
-                                updated_count += 1
-                        else:
-                            logging.debug(f"No changes for: '{task.get('title', '')}'")
-
-                    except Exception as e:
+                entry = entries.get(original_id)
+                if entry is not None:
+                    trmnl_id = entry['trmnl_id']
+                    trmnl_task = trmnl_tasks.get(trmnl_id)
+
+                    if trmnl_task is None:
                         # TRMNL task no longer exists, recreate it
-                        logging.warning(f"TRMNL task {trmnl_id} not found, recreating: {e}")
-                        if self.create_trmnl_task(task, list_id, trmnl_list_id):
-                            created_count += 1
+                        logging.warning(f"TRMNL task {trmnl_id} not found, recreating")
+                        to_create.append(task)
+                        continue
+
+                    if trmnl_id in claimed_trmnl_ids:
+                        # Shared with a task whose content now differs: split off
+                        logging.info(f"No longer identical to a shared task, creating own copy: '{task.get('title', '')}'")
+                        to_create.append(task)
+                        continue
+                    claimed_trmnl_ids.add(trmnl_id)
+
+                    # Unchanged since the last write: one hash compare instead
+                    # of comparing title and notes
+                    if entry.get('sig') == sig:
+                        logging.debug(f"No changes for: '{task.get('title', '')}'")
+                    elif self.task_needs_update(task, trmnl_task):
+                        to_update.append((task, trmnl_task))
+                    else:
+                        logging.debug(f"No changes for: '{task.get('title', '')}'")
+                        self._set_signature(original_id, sig)
                 else:
                     # Create new TRMNL task
-                    if self.create_trmnl_task(task, list_id, trmnl_list_id):
-                        created_count += 1
+                    to_create.append(task)
+
+        created_count = self.create_trmnl_tasks(to_create, trmnl_list_id)
+        updated_count = self.update_trmnl_tasks(to_update, trmnl_list_id)
 
         logging.info(f"Sync results: {created_count} created, {updated_count} updated")
 
+        self._map_duplicates(duplicates)
+
         # Cleanup: remove TRMNL tasks whose originals are no longer starred/exist
-        self.cleanup_trmnl_tasks(trmnl_list_id, seen_original_ids)
+        deleted_count = self.cleanup_trmnl_tasks(trmnl_list_id, seen_original_ids, trmnl_tasks.values())
+
+        # Advance the scan cursor, slightly overlapped to allow for clock skew;
+        # kept in place after a failed scan so the missed changes are retried.
+        # The cursor alone does not make the file dirty, so idle cycles write
+        # nothing; an older saved cursor only widens the next scan.
+        if not self.dry_run and not self._scan_failed:
+            self.mappings['last_scan'] = (scan_started - SCAN_OVERLAP).isoformat()
+            if full_scan:
+                self.mappings['last_full_scan'] = scan_started.isoformat()
+                self._mappings_dirty = True
 
         # Save updated mappings
         self._save_mappings()
         logging.info("Sync complete")
+        return created_count + updated_count + deleted_count
 
-    def cleanup_trmnl_tasks(self, trmnl_list_id: str, valid_original_ids: set):
+    def cleanup_trmnl_tasks(self, trmnl_list_id: str, valid_original_ids: set, trmnl_tasks: Iterable[Dict]) -> int:
         """Remove TRMNL tasks whose originals are gone/untagged/completed.
 
         Args:
             trmnl_list_id: TRMNL list ID
             valid_original_ids: Set of original task IDs that still exist and are tagged
+            trmnl_tasks: All current TRMNL tasks, including completed ones
+
+        Returns:
+            Number of TRMNL tasks deleted
         """
         logging.info("Cleaning up stale TRMNL tasks...")
 
-        # Get all current TRMNL tasks
-        trmnl_tasks = self.get_tasks_in_list(trmnl_list_id, include_completed=True)
+        entries = self.mappings['entries']
+
+        # TRMNL tasks still backing a valid original (duplicates share one)
+        live_trmnl_ids = {}
+        for original_id in valid_original_ids:
+            entry = entries.get(original_id)
+            if entry is not None:
+                live_trmnl_ids[entry['trmnl_id']] = original_id
 
-        deleted_count = 0
+        # Forget originals that are gone while their shared TRMNL task lives on
+        for original_id in [o for o, e in entries.items()
+                            if o not in valid_original_ids and e['trmnl_id'] in live_trmnl_ids]:
+            trmnl_id = entries.pop(original_id)['trmnl_id']
+            self._trmnl_to_original[trmnl_id] = live_trmnl_ids[trmnl_id]
+            self._mappings_dirty = True
+
+        to_delete = []
+        trmnl_to_original = self._trmnl_to_original
 
         for trmnl_task in trmnl_tasks:
             trmnl_id = trmnl_task['id']
 
             # Check if this TRMNL task is mapped to an original
-            if trmnl_id in self.mappings['trmnl_to_original']:
-                original_id = self.mappings['trmnl_to_original'][trmnl_id]
-
-                # Delete if original is no longer valid (untagged, deleted, or completed)
-                if original_id not in valid_original_ids:
+            if trmnl_to_original.get(trmnl_id) is not None:
+                # Delete if no original is valid anymore (untagged, deleted, or completed)
+                if trmnl_id not in live_trmnl_ids:
                     logging.info(f"Original task no longer valid, deleting: '{trmnl_task.get('title', '')}'")
-                    self.delete_trmnl_task(trmnl_id, trmnl_list_id)
-                    deleted_count += 1
+                    to_delete.append(trmnl_id)
 
             # Also delete if task is completed in TRMNL
             elif trmnl_task.get('status') == 'completed':
                 logging.info(f"TRMNL task completed, deleting: '{trmnl_task.get('title', '')}'")
-                self.delete_trmnl_task(trmnl_id, trmnl_list_id)
-                deleted_count += 1
+                to_delete.append(trmnl_id)
+
+        deleted_count = self.delete_trmnl_tasks(to_delete, trmnl_list_id)
 
         if deleted_count > 0:
             logging.info(f"Cleaned up {deleted_count} stale TRMNL task(s)")
         else:
             logging.info("No cleanup needed")
 
-    def run_once(self):
-        """Run a single sync cycle."""
-        self.sync_tagged_tasks()
+        return deleted_count
+
+    def run_once(self, full_scan: bool = False):
+        """Run a single sync cycle.
+
+        Args:
+            full_scan: Scan all source lists instead of only changed tasks
+        """
+        self.sync_tagged_tasks(full_scan=full_scan)
 
     def run_daemon(self, interval_minutes: Optional[int] = None):
         """Run continuously, syncing at regular intervals.
@@ -590,21 +1242,52 @@ sync_interval_minutes = 15
         if interval_minutes is None:
             interval_minutes = self.config.get('sync_interval_minutes', 15)
 
-        interval_seconds = interval_minutes * 60
+        # Cycles without changes double the interval up to this ceiling
+        max_interval_minutes = max(interval_minutes, self.config.get('max_sync_interval_minutes', 60))
+        current_interval = interval_minutes
+        retry_attempt = 0
+
+        # SIGTERM (e.g. systemd stop) ends the wait between cycles right away
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
         logging.info(f"Starting daemon mode (interval: {interval_minutes} minutes)")
 
-        while True:
+        while not stop.is_set():
             try:
-                self.sync_tagged_tasks()
-                logging.info(f"Sleeping for {interval_minutes} minutes...")
-                time.sleep(interval_seconds)
+                self._refresh_credentials()
+                changes = self.sync_tagged_tasks()
+                retry_attempt = 0
+
+                if changes:
+                    current_interval = interval_minutes
+                else:
+                    current_interval = min(current_interval * 2, max_interval_minutes)
+
+                logging.info(f"Sleeping for {current_interval} minutes...")
+                stop.wait(current_interval * 60)
             except KeyboardInterrupt:
                 logging.info("Daemon mode interrupted by user")
                 break
+            except HttpError as e:
+                if e.resp.status not in RETRYABLE_STATUSES:
+                    logging.error(f"Error in daemon loop: {e}")
+                    logging.info(f"Continuing... next check in {interval_minutes} minutes")
+                    stop.wait(interval_minutes * 60)
+                    continue
+
+                # Rate limited or server error: retry soon with exponential backoff and jitter
+                retry_attempt += 1
+                delay = min(60, 2 ** retry_attempt) + random.uniform(0, 1)
+                logging.warning(f"Google Tasks API returned {e.resp.status}, retrying in {delay:.0f} seconds")
+                stop.wait(delay)
             except Exception as e:
                 logging.error(f"Error in daemon loop: {e}")
                 logging.info(f"Continuing... next check in {interval_minutes} minutes")
-                time.sleep(interval_seconds)
+                stop.wait(interval_minutes * 60)
+
+        if stop.is_set():
+            logging.info("Daemon mode stopped by SIGTERM")
 
 
 def main():
@@ -633,6 +1316,11 @@ def main():
         action='store_true',
         help='Show what would be done without making any changes'
     )
+    parser.add_argument(
+        '--full-scan',
+        action='store_true',
+        help='Scan all source lists instead of only tasks changed since the last sync (single run only)'
+    )
     parser.add_argument(
         '--interval',
         type=int,
@@ -655,7 +1343,7 @@ def main():
         if args.daemon:
             manager.run_daemon(interval_minutes=args.interval)
         else:
-            manager.run_once()
+            manager.run_once(full_scan=args.full_scan)
 
     except KeyboardInterrupt:
         logging.info("Interrupted by user")
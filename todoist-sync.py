@@ -13,54 +13,88 @@ Setup:
 3. Configure sync settings in the script
 """
 
+import hashlib
 import json
 import os
 import logging
+import signal
 import sys
-from datetime import datetime, timezone
-from typing import List, Optional
-import time
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 from confparser import load_config, create_default_config
 
 # Third-party imports
+import google_auth_httplib2
+import httplib2
+import requests
 from todoist_api_python.api import TodoistAPI
+from todoist_api_python.models import Task
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
-# Configure logging with custom handlers
-class StdoutHandler(logging.StreamHandler):
-    """Handler that only processes INFO and WARNING messages to stdout."""
-    def __init__(self):
-        super().__init__(sys.stdout)
-    
-    def emit(self, record):
-        if record.levelno in (logging.INFO, logging.WARNING):
-            super().emit(record)
-
-class StderrHandler(logging.StreamHandler):
-    """Handler that only processes ERROR and CRITICAL messages to stderr."""
-    def __init__(self):
-        super().__init__(sys.stderr)
-    
-    def emit(self, record):
-        if record.levelno >= logging.ERROR:
-            super().emit(record)
+# orjson is optional: much faster for large mapping files, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Relative paths (config, mappings, credentials) resolve against this for cron compatibility
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Google caps HTTP batch requests at 100 calls
+BATCH_SIZE = 100
+
+# Largest page size accepted by tasks.list
+PAGE_SIZE = 100
+
+# Partial response masks: only request the fields the sync looks at
+TASK_FIELDS = 'nextPageToken,items(id,title,notes,due,status,updated)'
+# Writes only need the ID and version of the task back
+WRITE_FIELDS = 'id,updated'
+
+# How long a resolved target list ID is reused before looking it up again
+LIST_ID_TTL = timedelta(hours=24)
+
+# Completion checks start this much before the previous check began
+SCAN_OVERLAP = timedelta(minutes=5)
+
+# Mapping keys that change on every sync; on their own they don't warrant rewriting the file
+VOLATILE_MAPPING_KEYS = ("last_sync", "completions_checked_at")
+
+# Todoist Sync API: returns only items changed since the given sync token
+TODOIST_SYNC_URL = "https://api.todoist.com/api/v1/sync"
 
-# Set up logger with custom handlers
+# Todoist caps a Sync API request at 100 commands
+TODOIST_COMMAND_LIMIT = 100
+
+# Configure logging: stdout below ERROR, stderr from ERROR up
+class StdoutFilter(logging.Filter):
+    """Filter to keep ERROR and CRITICAL off stdout (they go to stderr)."""
+    def filter(self, record):
+        return record.levelno < logging.ERROR
+
+# Set up logger with stdout/stderr handlers
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Create formatters
 formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
-# Create and configure handlers
-stdout_handler = StdoutHandler()
+# Create and configure handlers; the stderr handler's level check runs
+# before any formatting, so only the stdout handler needs a filter
+stdout_handler = logging.StreamHandler(sys.stdout)
+stdout_handler.addFilter(StdoutFilter())
 stdout_handler.setFormatter(formatter)
 
-stderr_handler = StderrHandler()
+stderr_handler = logging.StreamHandler(sys.stderr)
+stderr_handler.setLevel(logging.ERROR)
 stderr_handler.setFormatter(formatter)
 
 # Add handlers to logger
@@ -70,82 +104,142 @@ logger.addHandler(stderr_handler)
 # Prevent duplicate messages from root logger
 logger.propagate = False
 
+def _json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to a fsynced temporary file and swap it in with os.replace.
+
+    A crash mid-write never leaves a truncated file behind.
+    """
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
 class TaskSyncManager:
     """Manages synchronization between Todoist and Google Tasks."""
     
     def __init__(self, config_file: str = "todoist-sync.conf", verbose: bool = False):
         # Resolve paths relative to script directory for cron compatibility
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_file = os.path.join(script_dir, config_file) if not os.path.isabs(config_file) else config_file
-        self.mapping_file = os.path.join(script_dir, "todoist-sync-mappings.json")
+        self.config_file = os.path.join(SCRIPT_DIR, config_file) if not os.path.isabs(config_file) else config_file
+        self.mapping_file = os.path.join(SCRIPT_DIR, "todoist-sync-mappings.json")
+        self.todoist_cache_file = os.path.join(SCRIPT_DIR, "todoist-sync-items.json")
+        self.http_cache_dir = os.path.join(SCRIPT_DIR, ".todoist-sync-cache")
         self.verbose = verbose
         self.load_config()
         self.load_mappings()
+        self.load_todoist_cache()
+        
+        # Todoist tasks fetched during the current sync cycle
+        self._todoist_tasks = None
+        self._todoist_task_cache: Dict[str, Task] = {}
+        self._gtasks_fetch_failed = False
         
         # Initialize APIs
         self.todoist = TodoistAPI(self.config['todoist_token'])
         self.gtasks = self._init_google_tasks()
     
+    @staticmethod
+    def _content_hash(todoist_task) -> str:
+        """Hash the Todoist fields that determine the Google Task's content."""
+        due = getattr(todoist_task, 'due', None)
+        deadline = getattr(todoist_task, 'deadline', None)
+        data = f"{todoist_task.content}\x00{todoist_task.id}\x00{due!r}\x00{deadline!r}"
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _extract_date(value):
+        """Parse a Todoist due/deadline (object or string) into a date, or None."""
+        date_value = getattr(value, 'date', None)
+        try:
+            if date_value:
+                if isinstance(date_value, str):
+                    return date.fromisoformat(date_value)
+                return date_value
+            datetime_value = getattr(value, 'datetime', None)
+            if datetime_value:
+                return datetime.fromisoformat(datetime_value.replace('Z', '+00:00')).date()
+            if isinstance(value, str):
+                if 'T' in value:
+                    return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+                return date.fromisoformat(value)
+        except (ValueError, AttributeError):
+            pass
+        return None
+    
+    @classmethod
+    def _task_date(cls, task):
+        """Date a Todoist task is due: its due date, or its deadline if it has no due date."""
+        due = getattr(task, 'due', None)
+        if due:
+            return cls._extract_date(due)
+        deadline = getattr(task, 'deadline', None)
+        if deadline:
+            return cls._extract_date(deadline)
+        return None
+    
+    def _record_version(self, todoist_id: str, content_hash: str, gtask_updated: Optional[str]):
+        """Remember the content hash and Google Task version a mapping was last synced at."""
+        self.mappings['content_hashes'][todoist_id] = content_hash
+        self.mappings['gtask_versions'][todoist_id] = gtask_updated
+    
+    def _forget_version(self, todoist_id: str):
+        """Drop the recorded sync state of a mapping that is being removed."""
+        self.mappings['content_hashes'].pop(todoist_id, None)
+        self.mappings['gtask_versions'].pop(todoist_id, None)
+    
     def tasks_are_different(self, gtask, todoist_task) -> bool:
         """Check if Google Task and Todoist task have differences that require updating."""
+        # Neither side changed since the Google Task was last written or verified
+        todoist_id = str(todoist_task.id)
+        content_hash = self._content_hash(todoist_task)
+        if (self.mappings['content_hashes'].get(todoist_id) == content_hash
+                and self.mappings['gtask_versions'].get(todoist_id) == gtask.get('updated')):
+            logger.debug("    Content hash and Google Task version unchanged - skipping update")
+            return False
+        
         # Compare title
         if gtask.get('title', '') != todoist_task.content:
-            if self.verbose:
-                logger.info(f"    Title differs: '{gtask.get('title', '')}' vs '{todoist_task.content}'")
+            logger.debug("    Title differs: '%s' vs '%s'", gtask.get('title', ''), todoist_task.content)
             return True
         
-        # Compare notes - build expected notes with deadline if both due date and deadline exist
-        expected_notes = f"Synced from Todoist\nOriginal ID: {todoist_task.id}"
-        
-        has_due = hasattr(todoist_task, 'due') and todoist_task.due
-        has_deadline = hasattr(todoist_task, 'deadline') and todoist_task.deadline
-        
-        if has_due and has_deadline:
-            deadline_str = ""
-            if isinstance(todoist_task.deadline, str):
-                deadline_str = todoist_task.deadline
-            else:
-                if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                    if isinstance(todoist_task.deadline.date, str):
-                        deadline_str = todoist_task.deadline.date
-                    else:
-                        deadline_str = todoist_task.deadline.date.strftime("%Y-%m-%d")
-                elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                    deadline_str = todoist_task.deadline.datetime
-                else:
-                    deadline_str = str(todoist_task.deadline)
-            
-            expected_notes += f"\nDeadline: {deadline_str}"
-        
-        if gtask.get('notes', '') != expected_notes:
-            if self.verbose:
-                logger.info(f"    Notes differ: '{gtask.get('notes', '')}' vs '{expected_notes}'")
+        # Compare notes - fixed prefix first, then only the deadline line after it
+        notes = gtask.get('notes', '')
+        prefix = self._notes_prefix(todoist_task)
+        if not notes.startswith(prefix) or notes[len(prefix):] != self._notes_deadline(todoist_task):
+            logger.debug("    Notes differ: '%s' vs '%s'", notes, self._build_notes(todoist_task))
             return True
         
         # Skip due date comparison to prevent overwriting Google Tasks due date changes
         # Due dates only sync from Todoist -> Google Tasks, not the reverse
         # This allows users to modify due dates in Google Tasks without them being reset
-        if self.verbose:
-            logger.info(f"    Skipping due date comparison (due dates don't sync Google Tasks -> Todoist)")
-        
-        if self.verbose:
-            logger.info(f"    No differences found - skipping update")
+        logger.debug("    No differences found (due dates don't sync Google Tasks -> Todoist) - skipping update")
+        self._record_version(todoist_id, content_hash, gtask.get('updated'))
         return False
 
     def _should_complete_todoist_task(self, gtask, todoist_id: str) -> bool:
         """Check if we should complete a Todoist task based on date comparison with completed Google Task."""
-        from datetime import datetime, timezone
-
         try:
             # Get the current Todoist task to check its due date
-            todoist_task = self.todoist.get_task(task_id=todoist_id)
+            todoist_task = self._get_todoist_task(todoist_id)
 
             # Get Google Task due date
             gtask_due = gtask.get('due')
             if not gtask_due:
                 # If Google Task has no due date, allow completion
-                if self.verbose:
-                    logger.info(f"    Google Task has no due date - allowing completion")
+                logger.debug("    Google Task has no due date - allowing completion")
                 return True
 
             # Parse Google Task due date
@@ -153,84 +247,35 @@ class TaskSyncManager:
                 gtask_due_date = datetime.fromisoformat(gtask_due.replace('Z', '+00:00')).date()
             except (ValueError, AttributeError):
                 # If we can't parse the Google Task date, allow completion
-                if self.verbose:
-                    logger.info(f"    Could not parse Google Task due date '{gtask_due}' - allowing completion")
+                logger.debug("    Could not parse Google Task due date '%s' - allowing completion", gtask_due)
                 return True
 
             # Get Todoist task due date
-            todoist_due_date = None
-            has_due = hasattr(todoist_task, 'due') and todoist_task.due
-            has_deadline = hasattr(todoist_task, 'deadline') and todoist_task.deadline
-
-            if has_due:
-                if hasattr(todoist_task.due, 'date') and todoist_task.due.date:
-                    if isinstance(todoist_task.due.date, str):
-                        try:
-                            todoist_due_date = datetime.strptime(todoist_task.due.date, '%Y-%m-%d').date()
-                        except ValueError:
-                            pass
-                    else:
-                        todoist_due_date = todoist_task.due.date
-                elif hasattr(todoist_task.due, 'datetime') and todoist_task.due.datetime:
-                    try:
-                        todoist_due_date = datetime.fromisoformat(todoist_task.due.datetime.replace('Z', '+00:00')).date()
-                    except (ValueError, AttributeError):
-                        pass
-            elif has_deadline:
-                # Handle deadline object similar to due date
-                if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                    if isinstance(todoist_task.deadline.date, str):
-                        try:
-                            todoist_due_date = datetime.strptime(todoist_task.deadline.date, '%Y-%m-%d').date()
-                        except ValueError:
-                            pass
-                    else:
-                        todoist_due_date = todoist_task.deadline.date
-                elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                    try:
-                        todoist_due_date = datetime.fromisoformat(todoist_task.deadline.datetime.replace('Z', '+00:00')).date()
-                    except (ValueError, AttributeError):
-                        pass
-                elif isinstance(todoist_task.deadline, str):
-                    try:
-                        if 'T' in todoist_task.deadline:
-                            todoist_due_date = datetime.fromisoformat(todoist_task.deadline.replace('Z', '+00:00')).date()
-                        else:
-                            todoist_due_date = datetime.strptime(todoist_task.deadline, '%Y-%m-%d').date()
-                    except ValueError:
-                        pass
+            todoist_due_date = self._task_date(todoist_task)
 
             if not todoist_due_date:
                 # If Todoist task has no due date, allow completion
-                if self.verbose:
-                    logger.info(f"    Todoist task has no due date - allowing completion")
+                logger.debug("    Todoist task has no due date - allowing completion")
                 return True
 
             # Compare dates
-            if self.verbose:
-                logger.info(f"    Google Task due date: {gtask_due_date}")
-                logger.info(f"    Todoist task due date: {todoist_due_date}")
+            logger.debug("    Google Task due date: %s, Todoist task due date: %s", gtask_due_date, todoist_due_date)
 
             # Only complete if Todoist task is not significantly in the future compared to Google Task
             # Allow completion if dates match or Todoist task is not more than 1 day after Google Task
             days_diff = (todoist_due_date - gtask_due_date).days
 
             if days_diff <= 1:  # Allow same day or 1 day difference
-                if self.verbose:
-                    logger.info(f"    Date difference: {days_diff} days - allowing completion")
+                logger.debug("    Date difference: %d days - allowing completion", days_diff)
                 return True
             else:
-                if self.verbose:
-                    logger.info(f"    Date difference: {days_diff} days - preventing completion (Todoist task is too far in future)")
+                logger.debug("    Date difference: %d days - preventing completion (Todoist task is too far in future)", days_diff)
                 logger.warning(f"Skipping completion of Todoist task '{todoist_task.content}' - it's due {days_diff} days after the completed Google Task")
                 return False
 
         except Exception as e:
             # If there's any error checking dates, err on the side of caution and allow completion
-            logger.warning(f"Error checking dates for task completion: {e}")
-            if self.verbose:
-                import traceback
-                logger.warning(f"Full traceback: {traceback.format_exc()}")
+            logger.warning(f"Error checking dates for task completion: {e}", exc_info=self.verbose)
             return True
 
     def load_config(self):
@@ -256,6 +301,9 @@ target_gtasks_list = @default
 
 # How often to sync in daemon mode (minutes)
 sync_interval_minutes = 15
+
+# Fetch all Todoist tasks every sync instead of only changes since the last one
+force_full_sync = false
 """
 
         defaults = {
@@ -265,7 +313,8 @@ sync_interval_minutes = 15
             'sync_priority_tasks': True,
             'sync_labels': ['urgent', 'important', 'sync'],
             'target_gtasks_list': '@default',
-            'sync_interval_minutes': 15
+            'sync_interval_minutes': 15,
+            'force_full_sync': False
         }
 
         if not os.path.exists(self.config_file):
@@ -276,10 +325,9 @@ sync_interval_minutes = 15
         self.config = load_config(self.config_file, defaults)
 
         # Resolve credential paths relative to script directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
         for key in ('google_credentials_file', 'google_token_file'):
             if self.config.get(key) and not os.path.isabs(self.config[key]):
-                self.config[key] = os.path.join(script_dir, self.config[key])
+                self.config[key] = os.path.join(SCRIPT_DIR, self.config[key])
 
         # Handle sync_labels as string (if not parsed as list)
         if isinstance(self.config.get('sync_labels'), str):
@@ -290,20 +338,62 @@ sync_interval_minutes = 15
     def load_mappings(self):
         """Load task ID mappings between platforms."""
         if os.path.exists(self.mapping_file):
-            with open(self.mapping_file, 'r') as f:
-                self.mappings = json.load(f)
+            with open(self.mapping_file, 'rb') as f:
+                self.mappings = _json_loads(f.read())
+            self._saved_digest = self._mappings_digest()
         else:
             self.mappings = {
                 "todoist_to_gtasks": {},  # todoist_id -> gtasks_id
                 "gtasks_to_todoist": {},  # gtasks_id -> todoist_id
                 "last_sync": None
             }
+            self._saved_digest = None
+        # todoist_id -> hash of the content last written to its Google Task
+        self.mappings.setdefault("content_hashes", {})
+        # todoist_id -> 'updated' timestamp of its Google Task when last written or verified
+        self.mappings.setdefault("gtask_versions", {})
+    
+    def _mappings_digest(self) -> bytes:
+        """Digest of the mappings, ignoring timestamps that change on every sync."""
+        state = {key: value for key, value in self.mappings.items() if key not in VOLATILE_MAPPING_KEYS}
+        return hashlib.blake2b(_json_dumps(state), digest_size=16).digest()
     
     def save_mappings(self):
-        """Save task ID mappings to file."""
+        """Save task ID mappings to file if they changed since the last load or save."""
         self.mappings["last_sync"] = datetime.now(timezone.utc).isoformat()
-        with open(self.mapping_file, 'w') as f:
-            json.dump(self.mappings, f, indent=2)
+        
+        digest = self._mappings_digest()
+        if digest == self._saved_digest:
+            if self.verbose:
+                logger.info("Mappings unchanged, not saving")
+            return
+        
+        _write_atomic(self.mapping_file, _json_dumps(self.mappings))
+        self._saved_digest = digest
+    
+    def load_todoist_cache(self):
+        """Load the Todoist Sync API token and the active items fetched with it.
+
+        They are kept apart from the mappings, which only hold ID pairs and
+        per-task state. Files written before the split have them in the
+        mappings; they are moved over and dropped from there on the next save.
+        """
+        legacy_token = self.mappings.pop('todoist_sync_token', None)
+        legacy_items = self.mappings.pop('todoist_items', None)
+        if os.path.exists(self.todoist_cache_file):
+            with open(self.todoist_cache_file, 'rb') as f:
+                self.todoist_cache = _json_loads(f.read())
+            self._todoist_cache_dirty = False
+        else:
+            self.todoist_cache = {"sync_token": legacy_token, "items": legacy_items or {}}
+            self._todoist_cache_dirty = legacy_token is not None
+    
+    def save_todoist_cache(self):
+        """Save the Todoist sync token and item cache to file if they changed."""
+        if not self._todoist_cache_dirty:
+            return
+        _write_atomic(self.todoist_cache_file, _json_dumps(self.todoist_cache))
+        self._todoist_cache_dirty = False
     
     def _init_google_tasks(self):
         """Initialize Google Tasks API client."""
@@ -336,12 +426,37 @@ sync_interval_minutes = 15
             with open(token_file, 'w') as token:
                 token.write(creds.to_json())
         
-        return build('tasks', 'v1', credentials=creds)
+        # httplib2's file cache stores each list response with its ETag and
+        # revalidates it with If-None-Match, so unchanged lists come back as
+        # a bodiless 304
+        http = httplib2.Http(cache=self.http_cache_dir)
+        # Use the discovery document bundled with google-api-python-client
+        # instead of fetching it over HTTPS on every start
+        return build('tasks', 'v1', http=google_auth_httplib2.AuthorizedHttp(creds, http=http),
+                     static_discovery=True, cache_discovery=False)
     
     def get_target_gtasks_list_id(self) -> str:
-        """Get the target Google Tasks list ID."""
+        """Get the target Google Tasks list ID, reusing the last resolved ID when still fresh."""
         target_list = self.config['target_gtasks_list']
         
+        cached = self.mappings.get('target_gtasks_list')
+        if cached and cached['name'] == target_list:
+            resolved_at = datetime.fromisoformat(cached['resolved_at'])
+            if datetime.now(timezone.utc) - resolved_at < LIST_ID_TTL:
+                if self.verbose:
+                    logger.info(f"Using cached Google Tasks list ID: {cached['id']}")
+                return cached['id']
+        
+        list_id = self._resolve_target_gtasks_list_id(target_list)
+        self.mappings['target_gtasks_list'] = {
+            'name': target_list,
+            'id': list_id,
+            'resolved_at': datetime.now(timezone.utc).isoformat()
+        }
+        return list_id
+    
+    def _resolve_target_gtasks_list_id(self, target_list: str) -> str:
+        """Look up (or create) the Google Tasks list named target_list."""
         if self.verbose:
             logger.info(f"Looking for Google Tasks list: '{target_list}'")
         
@@ -384,136 +499,107 @@ sync_interval_minutes = 15
                 logger.info(f"✓ Created new list: '{target_list}' (ID: {new_list['id']})")
             return new_list['id']
     
-    def should_sync_todoist_task(self, task) -> bool:
-        """Check if a Todoist task should be synced."""
-        settings = self.config
-        
-        if self.verbose:
-            logger.info(f"Evaluating task: '{task.content}' (ID: {task.id})")
-            logger.info(f"  Task priority: {task.priority}")
-            logger.info(f"  Task labels: {getattr(task, 'labels', 'No labels attribute')}")
-            
-            # Check due date, deadline and recurring status
-            due_info = getattr(task, 'due', None)
-            deadline = getattr(task, 'deadline', None)
-            if due_info:
-                is_recurring = getattr(due_info, 'is_recurring', False)
-                due_date = getattr(due_info, 'date', None) or getattr(due_info, 'datetime', None)
-                logger.info(f"  Due date: {due_date}")
-                logger.info(f"  Is recurring: {is_recurring}")
-            else:
-                logger.info(f"  Due date: None")
-                logger.info(f"  Is recurring: False (no due date)")
-            
-            if deadline:
-                logger.info(f"  Deadline: {deadline}")
-            else:
-                logger.info(f"  Deadline: None")
+    def should_sync_todoist_task(self, task, sync_labels: frozenset, sync_priority: bool, today) -> bool:
+        """Check if a Todoist task should be synced.
         
-        # First check: Must have either due date or deadline
-        has_due_date = hasattr(task, 'due') and task.due and (
-            (hasattr(task.due, 'date') and task.due.date) or 
-            (hasattr(task.due, 'datetime') and task.due.datetime)
+        sync_labels, sync_priority and today are the same for every task in a
+        sync, so the caller computes them once.
+        """
+        logger.debug(
+            "Evaluating task: '%s' (ID: %s) priority=%s labels=%s due=%s deadline=%s",
+            task.content, task.id, task.priority, getattr(task, 'labels', None),
+            getattr(task, 'due', None), getattr(task, 'deadline', None)
         )
-        has_deadline = hasattr(task, 'deadline') and task.deadline
+        
+        # Priority (priority 4 is p1, 3 is p2, 2 is p3, 1 is p4/no priority) or label must match;
+        # checked first as it is the cheapest test and rules out most tasks
+        priority_check = sync_priority and task.priority >= 2
+        label_check = not sync_labels.isdisjoint(getattr(task, 'labels', None) or ())
+        if not (priority_check or label_check):
+            logger.debug("  Priority check: %s, label check: %s - skipping sync", priority_check, label_check)
+            return False
+        
+        # Must have either due date or deadline
+        due = getattr(task, 'due', None)
+        has_due_date = due and (getattr(due, 'date', None) or getattr(due, 'datetime', None))
+        has_deadline = getattr(task, 'deadline', None)
         
         if not has_due_date and not has_deadline:
-            if self.verbose:
-                logger.info(f"  Task has no due date or deadline - skipping sync")
+            logger.debug("  Task has no due date or deadline - skipping sync")
             return False
         
         # Check for tasks with future due dates (applies to all tasks, not just recurring)
-        from datetime import datetime
-        
-        due_date = None
-        # Check due date from either due or deadline
-        if hasattr(task, 'due') and task.due:
-            if hasattr(task.due, 'date') and task.due.date:
-                if isinstance(task.due.date, str):
-                    try:
-                        due_date = datetime.strptime(task.due.date, '%Y-%m-%d').date()
-                    except ValueError:
-                        due_date = None
-                else:
-                    due_date = task.due.date
-            elif hasattr(task.due, 'datetime') and task.due.datetime:
-                try:
-                    due_date = datetime.fromisoformat(task.due.datetime.replace('Z', '+00:00')).date()
-                except (ValueError, AttributeError):
-                    due_date = None
-        elif hasattr(task, 'deadline') and task.deadline:
-            # Handle deadline object - check for date attribute
-            if hasattr(task.deadline, 'date') and task.deadline.date:
-                if isinstance(task.deadline.date, str):
-                    try:
-                        due_date = datetime.strptime(task.deadline.date, '%Y-%m-%d').date()
-                    except ValueError:
-                        due_date = None
-                else:
-                    due_date = task.deadline.date
-            elif hasattr(task.deadline, 'datetime') and task.deadline.datetime:
-                try:
-                    due_date = datetime.fromisoformat(task.deadline.datetime.replace('Z', '+00:00')).date()
-                except (ValueError, AttributeError):
-                    due_date = None
-            elif isinstance(task.deadline, str):
-                try:
-                    if 'T' in task.deadline:
-                        due_date = datetime.fromisoformat(task.deadline.replace('Z', '+00:00')).date()
-                    else:
-                        due_date = datetime.strptime(task.deadline, '%Y-%m-%d').date()
-                except ValueError:
-                    due_date = None
+        due_date = self._task_date(task)
         
         if due_date:
-            today = datetime.now().date()
             days_until_due = (due_date - today).days
-            
-            is_recurring = hasattr(task, 'due') and task.due and hasattr(task.due, 'is_recurring') and task.due.is_recurring
-            
-            if self.verbose:
-                logger.info(f"  Due date parsed: {due_date}")
-                logger.info(f"  Days until due: {days_until_due}")
-                logger.info(f"  Is recurring: {is_recurring}")
-            
+            task_type = "Recurring task" if getattr(due, 'is_recurring', False) else "Task"
             if days_until_due > 1:
-                task_type = "recurring task" if is_recurring else "task"
-                if self.verbose:
-                    logger.info(f"  {task_type.capitalize()} due in {days_until_due} days - skipping sync")
+                logger.debug("  %s due %s, in %d days - skipping sync", task_type, due_date, days_until_due)
                 return False
-            else:
-                task_type = "recurring task" if is_recurring else "task"
-                if self.verbose:
-                    logger.info(f"  {task_type.capitalize()} due in {days_until_due} days - will sync")
+            logger.debug("  %s due %s, in %d days - will sync", task_type, due_date, days_until_due)
         else:
-            if self.verbose:
-                logger.info(f"  Could not parse due date - will sync")
+            logger.debug("  Could not parse due date - will sync")
         
-        # Check priority (priority 4 is p1, 3 is p2, 2 is p3, 1 is p4/no priority)
-        priority_check = settings.get('sync_priority_tasks', False) and task.priority >= 2
-        if self.verbose:
-            logger.info(f"  Priority check (sync_priority_tasks={settings.get('sync_priority_tasks', False)}, priority>={2}): {priority_check}")
+        return True
+    
+    def _fetch_changed_todoist_items(self) -> Dict:
+        """Bring the cached Todoist items up to date via the Sync API.
         
-        # Check labels
-        sync_labels = set(settings.get('sync_labels', []))
-        task_labels = set(task.labels) if hasattr(task, 'labels') and task.labels else set()
-        label_check = bool(sync_labels.intersection(task_labels))
-        if self.verbose:
-            logger.info(f"  Sync labels configured: {sync_labels}")
-            logger.info(f"  Task labels found: {task_labels}")
-            logger.info(f"  Label check (intersection): {label_check}")
+        The first call (sync token '*') returns every active item; later calls
+        return only items changed since the stored sync token, which are merged
+        into the cache. Completed and deleted items are dropped from it.
+        
+        Returns:
+            Dictionary mapping todoist_id -> raw item
+        """
+        sync_token = self.todoist_cache.get('sync_token') or '*'
+        if self.config.get('force_full_sync', False):
+            sync_token = '*'
         
-        should_sync = priority_check or label_check
+        response = requests.post(
+            TODOIST_SYNC_URL,
+            headers={'Authorization': f"Bearer {self.config['todoist_token']}"},
+            data={'sync_token': sync_token, 'resource_types': '["items"]'},
+            timeout=60
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        changed_items = result.get('items', [])
+        full_sync = result.get('full_sync', sync_token == '*')
+        items = {} if full_sync else self.todoist_cache.get('items', {})
         if self.verbose:
-            logger.info(f"  Final decision - Should sync: {should_sync}")
-            
-        return should_sync
+            sync_type = "full" if full_sync else "incremental"
+            logger.info(f"Todoist {sync_type} sync returned {len(changed_items)} changed items")
+        
+        for item in changed_items:
+            if item.get('is_deleted') or item.get('checked'):
+                items.pop(item['id'], None)
+            else:
+                items[item['id']] = item
+        
+        if full_sync or changed_items or result['sync_token'] != sync_token:
+            self.todoist_cache = {"sync_token": result['sync_token'], "items": items}
+            self._todoist_cache_dirty = True
+        return items
     
-    def get_todoist_tasks_to_sync(self) -> List:
-        """Get Todoist tasks that should be synced."""
+    def fetch_todoist_tasks(self) -> List:
+        """Fetch all active Todoist tasks, once per sync cycle."""
+        if self._todoist_tasks is not None:
+            return self._todoist_tasks
+        
+        if self.verbose:
+            logger.info("Fetching changed Todoist tasks...")
+        
         try:
-            if self.verbose:
-                logger.info("Fetching all Todoist tasks...")
+            items = self._fetch_changed_todoist_items()
+            all_tasks = [Task.from_dict(item) for item in items.values()]
+        except Exception as e:
+            logger.warning(f"Todoist incremental sync failed, fetching all tasks: {e}")
+            # Start over with a full sync next time
+            self.todoist_cache = {"sync_token": None, "items": {}}
+            self._todoist_cache_dirty = True
             
             # Handle pagination - get_tasks() returns a paginated iterator
             all_tasks = []
@@ -522,6 +608,25 @@ sync_interval_minutes = 15
             # Iterate through all pages to get all tasks
             for page in tasks_paginator:
                 all_tasks.extend(page)
+        
+        self._todoist_tasks = all_tasks
+        self._todoist_task_cache = {str(task.id): task for task in all_tasks}
+        return all_tasks
+    
+    def _get_todoist_task(self, task_id: str):
+        """Look up a Todoist task in this cycle's fetch, falling back to the REST API."""
+        self.fetch_todoist_tasks()
+        task = self._todoist_task_cache.get(str(task_id))
+        if task is None:
+            # Not active (already completed or deleted in Todoist) - ask directly
+            task = self.todoist.get_task(task_id=task_id)
+            self._todoist_task_cache[str(task_id)] = task
+        return task
+    
+    def get_todoist_tasks_to_sync(self) -> List:
+        """Get Todoist tasks that should be synced."""
+        try:
+            all_tasks = self.fetch_todoist_tasks()
             
             if self.verbose:
                 logger.info(f"Found {len(all_tasks)} total Todoist tasks")
@@ -530,17 +635,14 @@ sync_interval_minutes = 15
                 logger.info(f"  sync_labels: {self.config.get('sync_labels', [])}")
                 logger.info("")
             
-            eligible_tasks = []
-            for task in all_tasks:
-                if self.should_sync_todoist_task(task):
-                    eligible_tasks.append(task)
-                    if self.verbose:
-                        logger.info(f"✓ Task '{task.content}' marked for sync")
-                elif self.verbose:
-                    logger.info(f"✗ Task '{task.content}' skipped")
-                
-                if self.verbose:
-                    logger.info("")  # Empty line for readability
+            sync_labels = frozenset(self.config.get('sync_labels', []))
+            sync_priority = self.config.get('sync_priority_tasks', False)
+            today = datetime.now().date()
+            
+            eligible_tasks = [
+                task for task in all_tasks
+                if self.should_sync_todoist_task(task, sync_labels, sync_priority, today)
+            ]
             
             if self.verbose:
                 logger.info(f"Summary: {len(eligible_tasks)} out of {len(all_tasks)} tasks will be synced")
@@ -548,322 +650,391 @@ sync_interval_minutes = 15
             return eligible_tasks
             
         except Exception as e:
-            logger.error(f"Error fetching Todoist tasks: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error fetching Todoist tasks: {e}", exc_info=self.verbose)
             return []
     
-    def get_google_tasks(self, list_id: str, include_completed: bool = False) -> List:
-        """Get Google Tasks from specified list."""
+    def get_google_tasks(self, list_id: str, include_completed: bool = False,
+                         updated_min: Optional[str] = None, completed_min: Optional[str] = None) -> List:
+        """Get Google Tasks from specified list.
+        
+        With updated_min (RFC 3339), only tasks modified since then are returned;
+        with completed_min, only tasks completed since then.
+        Sets self._gtasks_fetch_failed if the list could not be fetched.
+        """
+        self._gtasks_fetch_failed = False
+        params = {'tasklist': list_id}
+        # The include_completed parameter doesn't seem to work reliably
+        # Use the direct API call instead
+        if include_completed:
+            params.update(showCompleted=True, showHidden=True)
+        if updated_min:
+            params['updatedMin'] = updated_min
+        if completed_min:
+            params['completedMin'] = completed_min
+        
         try:
-            # The include_completed parameter doesn't seem to work reliably
-            # Use the direct API call instead
-            if include_completed:
-                result = self.gtasks.tasks().list(
-                    tasklist=list_id, 
-                    showCompleted=True, 
-                    showHidden=True
+            tasks = []
+            page_token = None
+            tasks_resource = self.gtasks.tasks()
+            while True:
+                result = tasks_resource.list(
+                    **params, maxResults=PAGE_SIZE, fields=TASK_FIELDS, pageToken=page_token
                 ).execute()
-            else:
-                result = self.gtasks.tasks().list(tasklist=list_id).execute()
-                
-            return result.get('items', [])
+                tasks.extend(result.get('items', []))
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    return tasks
+        except HttpError as e:
+            self._gtasks_fetch_failed = True
+            cached = self.mappings.get('target_gtasks_list')
+            if e.resp.status == 404 and cached and cached['id'] == list_id:
+                # Cached list was deleted - look it up again on the next call
+                del self.mappings['target_gtasks_list']
+            logger.error(f"Error fetching Google Tasks: {e}")
+            return []
         except Exception as e:
+            self._gtasks_fetch_failed = True
             logger.error(f"Error fetching Google Tasks: {e}")
             return []
     
-    def create_google_task(self, todoist_task, list_id: str) -> Optional[str]:
-        """Create a Google Task from Todoist task."""
-        try:
-            # Prepare task body with notes
-            notes = f"Synced from Todoist\nOriginal ID: {todoist_task.id}"
-            
-            # Handle dates: use due date for Google Task, mention deadline in description
-            due_date_for_gtask = None
-            has_due = hasattr(todoist_task, 'due') and todoist_task.due
-            has_deadline = hasattr(todoist_task, 'deadline') and todoist_task.deadline
-            
-            # Extract due date for Google Task
-            if has_due:
-                if hasattr(todoist_task.due, 'datetime') and todoist_task.due.datetime:
-                    due_date_for_gtask = todoist_task.due.datetime
-                elif hasattr(todoist_task.due, 'date') and todoist_task.due.date:
-                    if isinstance(todoist_task.due.date, str):
-                        due_date_for_gtask = todoist_task.due.date + "T00:00:00.000Z"
-                    else:
-                        due_date_for_gtask = todoist_task.due.date.strftime("%Y-%m-%dT00:00:00.000Z")
-                if self.verbose:
-                    logger.info(f"  Using due date for Google Task: {due_date_for_gtask}")
-            
-            # If no due date but has deadline, use deadline for Google Task
-            elif has_deadline:
-                if isinstance(todoist_task.deadline, str):
-                    if 'T' in todoist_task.deadline:
-                        due_date_for_gtask = todoist_task.deadline
-                    else:
-                        due_date_for_gtask = todoist_task.deadline + "T00:00:00.000Z"
-                else:
-                    # Handle deadline object
-                    if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                        if isinstance(todoist_task.deadline.date, str):
-                            due_date_for_gtask = todoist_task.deadline.date + "T00:00:00.000Z"
-                        else:
-                            due_date_for_gtask = todoist_task.deadline.date.strftime("%Y-%m-%dT00:00:00.000Z")
-                    elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                        due_date_for_gtask = todoist_task.deadline.datetime
-                    else:
-                        due_date_for_gtask = str(todoist_task.deadline) + "T00:00:00.000Z" if 'T' not in str(todoist_task.deadline) else str(todoist_task.deadline)
-                if self.verbose:
-                    logger.info(f"  Using deadline for Google Task (no due date): {due_date_for_gtask}")
-            
-            # Add deadline to description if both due date and deadline exist
-            if has_due and has_deadline:
-                deadline_str = ""
-                if isinstance(todoist_task.deadline, str):
-                    deadline_str = todoist_task.deadline
-                else:
-                    if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                        if isinstance(todoist_task.deadline.date, str):
-                            deadline_str = todoist_task.deadline.date
-                        else:
-                            deadline_str = todoist_task.deadline.date.strftime("%Y-%m-%d")
-                    elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                        deadline_str = todoist_task.deadline.datetime
-                    else:
-                        deadline_str = str(todoist_task.deadline)
-                
-                notes += f"\nDeadline: {deadline_str}"
-                if self.verbose:
-                    logger.info(f"  Added deadline to description: {deadline_str}")
-            
-            task_body = {
-                'title': todoist_task.content,
-                'notes': notes
-            }
-            
-            if due_date_for_gtask:
-                task_body['due'] = due_date_for_gtask
-            
-            if self.verbose:
-                logger.info(f"  Task body: {task_body}")
+    @staticmethod
+    def _notes_prefix(todoist_task) -> str:
+        """Fixed first part of the Google Task notes."""
+        return f"Synced from Todoist\nOriginal ID: {todoist_task.id}"
+    
+    @staticmethod
+    def _notes_deadline(todoist_task) -> str:
+        """Deadline line of the Google Task notes, only present if both due date and deadline exist."""
+        if not (getattr(todoist_task, 'due', None) and getattr(todoist_task, 'deadline', None)):
+            return ""
+        
+        deadline = todoist_task.deadline
+        if isinstance(deadline, str):
+            deadline_str = deadline
+        elif getattr(deadline, 'date', None):
+            if isinstance(deadline.date, str):
+                deadline_str = deadline.date
+            else:
+                deadline_str = deadline.date.isoformat()[:10]
+        elif getattr(deadline, 'datetime', None):
+            deadline_str = deadline.datetime
+        else:
+            deadline_str = str(deadline)
+        
+        return f"\nDeadline: {deadline_str}"
+    
+    @classmethod
+    def _build_notes(cls, todoist_task) -> str:
+        """Build the Google Task notes, mentioning the deadline if both due date and deadline exist."""
+        return cls._notes_prefix(todoist_task) + cls._notes_deadline(todoist_task)
+    
+    @staticmethod
+    def _gtask_due(todoist_task) -> Optional[str]:
+        """Google Task due timestamp for a Todoist task: its due date, else its deadline."""
+        due = getattr(todoist_task, 'due', None)
+        if due:
+            due_datetime = getattr(due, 'datetime', None)
+            if due_datetime:
+                return due_datetime
+            due_date = getattr(due, 'date', None)
+            if due_date:
+                if isinstance(due_date, str):
+                    return due_date + "T00:00:00.000Z"
+                return due_date.isoformat()[:10] + "T00:00:00.000Z"
+            return None
+        
+        deadline = getattr(todoist_task, 'deadline', None)
+        if not deadline:
+            return None
+        if isinstance(deadline, str):
+            return deadline if 'T' in deadline else deadline + "T00:00:00.000Z"
+        deadline_date = getattr(deadline, 'date', None)
+        if deadline_date:
+            if isinstance(deadline_date, str):
+                return deadline_date + "T00:00:00.000Z"
+            return deadline_date.isoformat()[:10] + "T00:00:00.000Z"
+        deadline_datetime = getattr(deadline, 'datetime', None)
+        if deadline_datetime:
+            return deadline_datetime
+        deadline_str = str(deadline)
+        return deadline_str if 'T' in deadline_str else deadline_str + "T00:00:00.000Z"
+    
+    def _build_google_task_body(self, todoist_task) -> Dict:
+        """Build the Google Tasks body (title, notes, due) for a Todoist task."""
+        # Handle dates: use due date for Google Task, mention deadline in description
+        due_date_for_gtask = self._gtask_due(todoist_task)
+        if self.verbose and due_date_for_gtask:
+            source = "due date" if getattr(todoist_task, 'due', None) else "deadline (no due date)"
+            logger.info(f"  Using {source} for Google Task: {due_date_for_gtask}")
+        
+        notes = self._build_notes(todoist_task)
+        if self.verbose and "\nDeadline: " in notes:
+            logger.info(f"  Added deadline to description: {notes.rsplit(': ', 1)[1]}")
+        
+        task_body = {
+            'title': todoist_task.content,
+            'notes': notes
+        }
+        
+        if due_date_for_gtask:
+            task_body['due'] = due_date_for_gtask
+        
+        return task_body
+    
+    def _execute_batched(self, requests: List[Tuple[str, object]], callback):
+        """Execute Google Tasks API requests as HTTP batches of at most BATCH_SIZE calls.
+        
+        When there is more than one batch, the mappings are checkpointed after
+        each, so an interrupted run keeps the IDs of the tasks already written.
+        
+        Args:
+            requests: List of (request_id, HttpRequest) pairs
+            callback: Called as callback(request_id, response, exception) per request
+        """
+        batch_count = (len(requests) + BATCH_SIZE - 1) // BATCH_SIZE
+        for number, start in enumerate(range(0, len(requests), BATCH_SIZE), 1):
+            batch = self.gtasks.new_batch_http_request(callback=callback)
+            for request_id, request in requests[start:start + BATCH_SIZE]:
+                batch.add(request, request_id=request_id)
+            batch.execute()
             
-            # Create task
-            result = self.gtasks.tasks().insert(tasklist=list_id, body=task_body).execute()
+            if batch_count > 1:
+                logger.info(f"Sent batch {number}/{batch_count} ({min(start + BATCH_SIZE, len(requests))}/{len(requests)} requests)")
+                self.save_mappings()
+    
+    def create_google_tasks(self, todoist_tasks: List, list_id: str) -> int:
+        """Create Google Tasks from Todoist tasks in batched requests.
+        
+        Returns:
+            Number of Google Tasks created
+        """
+        if not todoist_tasks:
+            return 0
+        
+        tasks_by_id = {str(task.id): task for task in todoist_tasks}
+        created = []
+        
+        def on_insert(todoist_id, response, exception):
+            todoist_task = tasks_by_id[todoist_id]
+            if exception is not None:
+                logger.error(f"Error creating Google Task '{todoist_task.content}': {exception}")
+                return
             
             # Update mappings
-            gtasks_id = result['id']
-            self.mappings['todoist_to_gtasks'][str(todoist_task.id)] = gtasks_id
-            self.mappings['gtasks_to_todoist'][gtasks_id] = str(todoist_task.id)
+            gtasks_id = response['id']
+            self.mappings['todoist_to_gtasks'][todoist_id] = gtasks_id
+            self.mappings['gtasks_to_todoist'][gtasks_id] = todoist_id
+            self._record_version(todoist_id, self._content_hash(todoist_task), response.get('updated'))
+            created.append(gtasks_id)
             
             logger.info(f"Created Google Task: {todoist_task.content}")
             if self.verbose:
                 logger.info(f"  Google Task ID: {gtasks_id}")
-            return gtasks_id
-            
-        except Exception as e:
-            logger.error(f"Error creating Google Task: {e}")
+        
+        requests = []
+        tasks_resource = self.gtasks.tasks()
+        for todoist_id, todoist_task in tasks_by_id.items():
+            task_body = self._build_google_task_body(todoist_task)
             if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
-                logger.info(f"Task due info: {getattr(todoist_task, 'due', 'No due date')}")
-                if hasattr(todoist_task, 'due') and todoist_task.due:
-                    logger.info(f"Due date type: {type(todoist_task.due.date) if hasattr(todoist_task.due, 'date') else 'No date attr'}")
-            return None
-    
-    def update_google_task(self, gtasks_id: str, todoist_task, list_id: str):
-        """Update existing Google Task."""
+                logger.info(f"  Task body: {task_body}")
+            requests.append((todoist_id, tasks_resource.insert(
+                tasklist=list_id, body=task_body, fields=WRITE_FIELDS
+            )))
+        
         try:
-            # Prepare task body with notes
-            notes = f"Synced from Todoist\nOriginal ID: {todoist_task.id}"
-            
-            # Handle dates: use due date for Google Task, mention deadline in description
-            due_date_for_gtask = None
-            has_due = hasattr(todoist_task, 'due') and todoist_task.due
-            has_deadline = hasattr(todoist_task, 'deadline') and todoist_task.deadline
-            
-            # Extract due date for Google Task
-            if has_due:
-                if hasattr(todoist_task.due, 'datetime') and todoist_task.due.datetime:
-                    due_date_for_gtask = todoist_task.due.datetime
-                elif hasattr(todoist_task.due, 'date') and todoist_task.due.date:
-                    if isinstance(todoist_task.due.date, str):
-                        due_date_for_gtask = todoist_task.due.date + "T00:00:00.000Z"
-                    else:
-                        due_date_for_gtask = todoist_task.due.date.strftime("%Y-%m-%dT00:00:00.000Z")
-                if self.verbose:
-                    logger.info(f"  Using due date for Google Task: {due_date_for_gtask}")
-            
-            # If no due date but has deadline, use deadline for Google Task
-            elif has_deadline:
-                if isinstance(todoist_task.deadline, str):
-                    if 'T' in todoist_task.deadline:
-                        due_date_for_gtask = todoist_task.deadline
-                    else:
-                        due_date_for_gtask = todoist_task.deadline + "T00:00:00.000Z"
-                else:
-                    # Handle deadline object
-                    if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                        if isinstance(todoist_task.deadline.date, str):
-                            due_date_for_gtask = todoist_task.deadline.date + "T00:00:00.000Z"
-                        else:
-                            due_date_for_gtask = todoist_task.deadline.date.strftime("%Y-%m-%dT00:00:00.000Z")
-                    elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                        due_date_for_gtask = todoist_task.deadline.datetime
-                    else:
-                        due_date_for_gtask = str(todoist_task.deadline) + "T00:00:00.000Z" if 'T' not in str(todoist_task.deadline) else str(todoist_task.deadline)
-                if self.verbose:
-                    logger.info(f"  Using deadline for Google Task (no due date): {due_date_for_gtask}")
-            
-            # Add deadline to description if both due date and deadline exist
-            if has_due and has_deadline:
-                deadline_str = ""
-                if isinstance(todoist_task.deadline, str):
-                    deadline_str = todoist_task.deadline
-                else:
-                    if hasattr(todoist_task.deadline, 'date') and todoist_task.deadline.date:
-                        if isinstance(todoist_task.deadline.date, str):
-                            deadline_str = todoist_task.deadline.date
-                        else:
-                            deadline_str = todoist_task.deadline.date.strftime("%Y-%m-%d")
-                    elif hasattr(todoist_task.deadline, 'datetime') and todoist_task.deadline.datetime:
-                        deadline_str = todoist_task.deadline.datetime
-                    else:
-                        deadline_str = str(todoist_task.deadline)
-                
-                notes += f"\nDeadline: {deadline_str}"
-                if self.verbose:
-                    logger.info(f"  Added deadline to description: {deadline_str}")
-            
-            task_body = {
-                'id': gtasks_id,  # Google Tasks API requires the ID in the body
-                'title': todoist_task.content,
-                'notes': notes
-            }
-            
-            if due_date_for_gtask:
-                task_body['due'] = due_date_for_gtask
-            
-            if self.verbose:
-                logger.info(f"  Updating with task body: {task_body}")
-            
-            self.gtasks.tasks().update(
-                tasklist=list_id, 
-                task=gtasks_id, 
-                body=task_body
-            ).execute()
-            
-            logger.info(f"Updated Google Task: {todoist_task.content}")
-            
+            self._execute_batched(requests, on_insert)
         except Exception as e:
-            logger.error(f"Error updating Google Task: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error creating Google Tasks: {e}", exc_info=self.verbose)
+        
+        return len(created)
     
-    def complete_todoist_task(self, task_id: str):
-        """Mark Todoist task as completed."""
-        try:
-            result = self.todoist.complete_task(task_id=task_id)
-            if self.verbose:
-                logger.info(f"  Used complete_task method, result: {result}")
-            logger.info(f"Completed Todoist task: {task_id}")
-        except Exception as e:
-            logger.error(f"Error completing Todoist task: {e}")
+    def update_google_tasks(self, updates: List[Tuple[str, object]], list_id: str) -> int:
+        """Update existing Google Tasks from Todoist tasks in batched requests.
+        
+        Args:
+            updates: List of (gtasks_id, todoist_task) pairs
+            list_id: Google Tasks list ID
+        
+        Returns:
+            Number of Google Tasks updated
+        """
+        if not updates:
+            return 0
+        
+        tasks_by_id = dict(updates)
+        titles_by_id = {gtasks_id: todoist_task.content for gtasks_id, todoist_task in updates}
+        updated = []
+        
+        def on_update(gtasks_id, response, exception):
+            if exception is not None:
+                logger.error(f"Error updating Google Task '{titles_by_id[gtasks_id]}': {exception}")
+                return
+            todoist_task = tasks_by_id[gtasks_id]
+            self._record_version(str(todoist_task.id), self._content_hash(todoist_task), response.get('updated'))
+            updated.append(gtasks_id)
+            logger.info(f"Updated Google Task: {titles_by_id[gtasks_id]}")
+        
+        requests = []
+        tasks_resource = self.gtasks.tasks()
+        for gtasks_id, todoist_task in updates:
+            task_body = self._build_google_task_body(todoist_task)
+            task_body['id'] = gtasks_id  # Google Tasks API requires the ID in the body
             if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
-                # Show available methods for debugging
-                methods = [method for method in dir(self.todoist) if not method.startswith('_')]
-                logger.info(f"Available TodoistAPI methods: {methods}")
-    
-    def sync_todoist_to_gtasks(self):
-        """Sync tasks from Todoist to Google Tasks."""
-        logger.info("Starting Todoist -> Google Tasks sync...")
+                logger.info(f"  Updating with task body: {task_body}")
+            requests.append((gtasks_id, tasks_resource.update(
+                tasklist=list_id,
+                task=gtasks_id,
+                body=task_body,
+                fields=WRITE_FIELDS
+            )))
         
-        if self.verbose:
-            logger.info("Step 1: Getting Todoist tasks to sync...")
+        try:
+            self._execute_batched(requests, on_update)
+        except Exception as e:
+            logger.error(f"Error updating Google Tasks: {e}", exc_info=self.verbose)
         
-        todoist_tasks = self.get_todoist_tasks_to_sync()
+        return len(updated)
+    
+    def complete_todoist_tasks(self, task_ids: List[str]) -> set:
+        """Mark Todoist tasks as completed with item_close commands through the Sync API.
         
-        if self.verbose:
-            logger.info("Step 2: Getting target Google Tasks list...")
+        Sends up to TODOIST_COMMAND_LIMIT commands per request instead of one
+        REST call per task.
         
-        list_id = self.get_target_gtasks_list_id()
+        Returns:
+            Set of task IDs that were completed
+        """
+        completed = set()
+        for start in range(0, len(task_ids), TODOIST_COMMAND_LIMIT):
+            chunk = task_ids[start:start + TODOIST_COMMAND_LIMIT]
+            commands = {str(uuid.uuid4()): task_id for task_id in chunk}
+            try:
+                response = requests.post(
+                    TODOIST_SYNC_URL,
+                    headers={'Authorization': f"Bearer {self.config['todoist_token']}"},
+                    data={'commands': json.dumps([
+                        {'type': 'item_close', 'uuid': command_uuid, 'args': {'id': task_id}}
+                        for command_uuid, task_id in commands.items()
+                    ])},
+                    timeout=60
+                )
+                response.raise_for_status()
+                sync_status = response.json().get('sync_status', {})
+            except Exception as e:
+                logger.error(f"Error completing Todoist tasks: {e}", exc_info=self.verbose)
+                continue
+            
+            for command_uuid, task_id in commands.items():
+                status = sync_status.get(command_uuid)
+                if status == 'ok':
+                    completed.add(task_id)
+                    self._todoist_task_cache.pop(str(task_id), None)
+                    logger.info(f"Completed Todoist task: {task_id}")
+                else:
+                    logger.error(f"Error completing Todoist task {task_id}: {status}")
         
-        if self.verbose:
-            logger.info("Step 3: Getting existing Google Tasks (incomplete only)...")
+        # Drop closed tasks from this cycle's fetch and the item cache, so the
+        # Todoist -> Google pass does not recreate them
+        if completed:
+            completed_ids = {str(task_id) for task_id in completed}
+            if self._todoist_tasks is not None:
+                self._todoist_tasks = [task for task in self._todoist_tasks if str(task.id) not in completed_ids]
+            items = self.todoist_cache.get('items', {})
+            for task_id in completed_ids:
+                if items.pop(task_id, None) is not None:
+                    self._todoist_cache_dirty = True
+        return completed
+    
+    def sync_todoist_to_gtasks(self):
+        """Sync tasks from Todoist to Google Tasks."""
+        logger.info("Starting Todoist -> Google Tasks sync...")
         
-        # Only get incomplete tasks for sync - completed ones are handled separately
-        gtasks = self.get_google_tasks(list_id, include_completed=False)
+        # The Todoist fetch (Step 1) runs in a worker thread while the Google
+        # Tasks lookups (Steps 2-3) run here; the two don't depend on each other
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if self.verbose:
+                logger.info("Step 1: Getting Todoist tasks to sync...")
+            todoist_future = executor.submit(self.get_todoist_tasks_to_sync)
+            
+            if self.verbose:
+                logger.info("Step 2: Getting target Google Tasks list...")
+            
+            list_id = self.get_target_gtasks_list_id()
+            
+            if not self.mappings['todoist_to_gtasks']:
+                # Nothing mapped yet (first sync or reset) - no existing task can match
+                if self.verbose:
+                    logger.info("Step 3: No mapped tasks - skipping Google Tasks listing")
+                gtasks = []
+            else:
+                if self.verbose:
+                    logger.info("Step 3: Getting existing Google Tasks (incomplete only)...")
+                
+                # Only get incomplete tasks for sync - completed ones are handled separately
+                gtasks = self.get_google_tasks(list_id, include_completed=False)
+                if self._gtasks_fetch_failed:
+                    # An empty result would orphan every mapping and recreate every task
+                    logger.error("Could not list Google Tasks - skipping Todoist -> Google Tasks sync")
+                    return
+            
+            todoist_tasks = todoist_future.result()
         
         if self.verbose:
             logger.info(f"Found {len(gtasks)} existing incomplete Google Tasks")
             logger.info("Step 4: Processing sync operations...")
         
-        # Get existing Google Tasks IDs
-        existing_gtasks_ids = {task['id'] for task in gtasks}
+        # Index existing Google Tasks by ID
+        gtask_by_id = {task['id']: task for task in gtasks}
         
-        # Clean up mappings for Google Tasks that no longer exist
-        orphaned_mappings = []
-        for todoist_id, gtasks_id in self.mappings['todoist_to_gtasks'].items():
-            if gtasks_id not in existing_gtasks_ids:
-                # Check if this Google Task was completed and cleaned up
-                if self.verbose:
-                    logger.info(f"Found orphaned mapping: Todoist {todoist_id} -> Google Task {gtasks_id}")
-                orphaned_mappings.append((todoist_id, gtasks_id))
-        
-        # Remove orphaned mappings
+        # Clean up mappings for Google Tasks that no longer exist (e.g. completed and cleaned up)
+        todoist_to_gtasks = self.mappings['todoist_to_gtasks']
+        orphaned_mappings = [
+            (todoist_id, gtasks_id) for todoist_id, gtasks_id in todoist_to_gtasks.items()
+            if gtasks_id not in gtask_by_id
+        ]
         for todoist_id, gtasks_id in orphaned_mappings:
             if self.verbose:
-                logger.info(f"Removing orphaned mapping for Todoist task {todoist_id}")
-            if todoist_id in self.mappings['todoist_to_gtasks']:
-                del self.mappings['todoist_to_gtasks'][todoist_id]
-            if gtasks_id in self.mappings['gtasks_to_todoist']:
-                del self.mappings['gtasks_to_todoist'][gtasks_id]
+                logger.info(f"Removing orphaned mapping: Todoist {todoist_id} -> Google Task {gtasks_id}")
+            del todoist_to_gtasks[todoist_id]
+            self.mappings['gtasks_to_todoist'].pop(gtasks_id, None)
+            self._forget_version(todoist_id)
         
         synced_count = 0
-        updated_count = 0
-        created_count = 0
+        to_create = []
+        to_update = []
         
         for i, task in enumerate(todoist_tasks, 1):
-            if self.verbose:
-                logger.info(f"Processing task {i}/{len(todoist_tasks)}: '{task.content}'")
+            logger.debug("Processing task %d/%d: '%s'", i, len(todoist_tasks), task.content)
             
             task_id_str = str(task.id)
             
             if task_id_str in self.mappings['todoist_to_gtasks']:
                 # Task already synced, check if we need to update
                 gtasks_id = self.mappings['todoist_to_gtasks'][task_id_str]
-                if self.verbose:
-                    logger.info(f"  Task already mapped to Google Task ID: {gtasks_id}")
+                logger.debug("  Task already mapped to Google Task ID: %s", gtasks_id)
                 
-                if gtasks_id in existing_gtasks_ids:
-                    # Find the corresponding Google Task to compare
-                    corresponding_gtask = next((gt for gt in gtasks if gt['id'] == gtasks_id), None)
-                    
-                    if corresponding_gtask and self.tasks_are_different(corresponding_gtask, task):
-                        if self.verbose:
-                            logger.info("  Differences found - updating existing Google Task...")
-                        self.update_google_task(gtasks_id, task, list_id)
-                        updated_count += 1
-                    elif self.verbose:
-                        logger.info("  No changes needed - skipping update")
+                corresponding_gtask = gtask_by_id.get(gtasks_id)
+                if corresponding_gtask is not None:
+                    if self.tasks_are_different(corresponding_gtask, task):
+                        logger.debug("  Differences found - updating existing Google Task...")
+                        to_update.append((gtasks_id, task))
+                    else:
+                        logger.debug("  No changes needed - skipping update")
                 else:
                     # This case should not happen now due to cleanup above
-                    if self.verbose:
-                        logger.info("  Mapping cleaned up, creating new Google Task...")
-                    self.create_google_task(task, list_id)
-                    created_count += 1
+                    logger.debug("  Mapping cleaned up, creating new Google Task...")
+                    to_create.append(task)
             else:
                 # New task to sync
-                if self.verbose:
-                    logger.info("  Creating new Google Task...")
-                self.create_google_task(task, list_id)
-                created_count += 1
+                logger.debug("  Creating new Google Task...")
+                to_create.append(task)
             
             synced_count += 1
         
+        # Send all creates and updates as HTTP batch requests
+        created_count = self.create_google_tasks(to_create, list_id)
+        updated_count = self.update_google_tasks(to_update, list_id)
+        
         logger.info(f"Sync summary: {synced_count} tasks processed ({created_count} created, {updated_count} updated, {synced_count - created_count - updated_count} unchanged)")
     
     def sync_completions_from_gtasks(self):
@@ -878,102 +1049,114 @@ sync_interval_minutes = 15
         if self.verbose:
             logger.info("Step 2: Getting all Google Tasks (including completed)...")
             logger.info(f"Current mappings count: {len(self.mappings['gtasks_to_todoist'])} Google->Todoist, {len(self.mappings['todoist_to_gtasks'])} Todoist->Google")
-            if self.mappings['gtasks_to_todoist']:
-                logger.info("Current Google->Todoist mappings:")
-                for gtask_id, todoist_id in self.mappings['gtasks_to_todoist'].items():
-                    logger.info(f"  {gtask_id} -> {todoist_id}")
+        if self.mappings['gtasks_to_todoist'] and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current Google->Todoist mappings:")
+            for gtask_id, todoist_id in self.mappings['gtasks_to_todoist'].items():
+                logger.debug("  %s -> %s", gtask_id, todoist_id)
+        
+        # Only tasks completed (and so updated) since the last check are new;
+        # the server filters out the rest, including all incomplete tasks
+        scan_started = datetime.now(timezone.utc)
+        updated_min = None if self.config.get('force_full_sync', False) else self.mappings.get('completions_checked_at')
         
-        # Get ALL tasks including completed ones
-        gtasks = self.get_google_tasks(list_id, include_completed=True)
+        # Get tasks including completed ones
+        gtasks = self.get_google_tasks(list_id, include_completed=True,
+                                       updated_min=updated_min, completed_min=updated_min)
+        fetch_failed = self._gtasks_fetch_failed
         
         if self.verbose:
-            logger.info(f"Found {len(gtasks)} Google Tasks to check (including completed)")
+            since = f" updated since {updated_min}" if updated_min else ""
+            logger.info(f"Found {len(gtasks)} Google Tasks{since} to check (including completed)")
         
-        completed_count = 0
         tasks_to_clean = []  # Track tasks to clean up after processing
         orphaned_completed_tasks = []  # Track completed tasks with no mapping
         
-        for i, gtask in enumerate(gtasks, 1):
-            gtasks_id = gtask.get('id')
-            if self.verbose:
-                status = gtask.get('status', 'needsAction')
-                logger.info(f"Checking task {i}/{len(gtasks)}: '{gtask.get('title', 'Untitled')}' (status: {status}, ID: {gtasks_id})")
-                
-                # Check if this task has a mapping
-                if gtasks_id in self.mappings['gtasks_to_todoist']:
-                    logger.info(f"  ✓ Has mapping to Todoist task: {self.mappings['gtasks_to_todoist'][gtasks_id]}")
-                else:
-                    logger.info(f"  ✗ No mapping found for this Google Task")
+        # Only completed tasks need any work; skip the rest in one pass
+        completed_gtasks = [gtask for gtask in gtasks if gtask.get('status') == 'completed']
+        if self.verbose:
+            logger.info(f"{len(completed_gtasks)} of them are completed")
+        
+        gtasks_to_todoist = self.mappings['gtasks_to_todoist']
+        for i, gtask in enumerate(completed_gtasks, 1):
+            gtasks_id = gtask['id']
+            todoist_id = gtasks_to_todoist.get(gtasks_id)
+            logger.debug("Checking completed task %d/%d: '%s' (ID: %s, Todoist task: %s)",
+                         i, len(completed_gtasks), gtask.get('title', 'Untitled'), gtasks_id, todoist_id)
             
-            if gtask.get('status') == 'completed':
-                if self.verbose:
-                    logger.info(f"  ✓ Task is completed, checking for Todoist mapping...")
+            if todoist_id is None:
+                logger.debug("  No mapping found for this completed Google Task - marking as orphaned")
+                # This is an orphaned completed task - clean it up
+                orphaned_completed_tasks.append((gtasks_id, gtask))
+            elif self._should_complete_todoist_task(gtask, todoist_id):
+                # Check if we should complete this task by comparing dates
+                logger.debug("  Date check passed - queueing Todoist task for completion...")
                 
-                if gtasks_id in self.mappings['gtasks_to_todoist']:
-                    todoist_id = self.mappings['gtasks_to_todoist'][gtasks_id]
-
-                    if self.verbose:
-                        logger.info(f"  Found mapping to Todoist task ID: {todoist_id}")
-
-                    # Check if we should complete this task by comparing dates
-                    should_complete = self._should_complete_todoist_task(gtask, todoist_id)
-
-                    if should_complete:
-                        if self.verbose:
-                            logger.info(f"  Date check passed - completing Todoist task...")
-
-                        # Complete the Todoist task
-                        self.complete_todoist_task(todoist_id)
-
-                        completed_count += 1
-
-                        # Mark for cleanup (don't modify mappings during iteration)
-                        tasks_to_clean.append((gtasks_id, todoist_id, gtask))
-                    else:
-                        if self.verbose:
-                            logger.info(f"  Date check failed - skipping completion but cleaning up Google Task")
-
-                        # Still clean up the completed Google Task even if we don't complete the Todoist task
-                        # Remove the mapping since the Google Task is completed and no longer relevant
-                        tasks_to_clean.append((gtasks_id, None, gtask))  # None indicates no Todoist completion
-                else:
-                    if self.verbose:
-                        logger.info(f"  No mapping found for this completed Google Task - marking as orphaned")
-                    # This is an orphaned completed task - clean it up
-                    orphaned_completed_tasks.append((gtasks_id, gtask))
-            elif self.verbose:
-                logger.info(f"  Task not completed, skipping")
+                # Mark for completion and cleanup (don't modify mappings during iteration)
+                tasks_to_clean.append((gtasks_id, todoist_id, gtask))
+            else:
+                logger.debug("  Date check failed - skipping completion but cleaning up Google Task")
+                
+                # Still clean up the completed Google Task even if we don't complete the Todoist task
+                # Remove the mapping since the Google Task is completed and no longer relevant
+                tasks_to_clean.append((gtasks_id, None, gtask))  # None indicates no Todoist completion
+        
+        # Complete the Todoist tasks in as few Sync API requests as possible;
+        # a task that could not be completed is cleaned up like a skipped one
+        completed_ids = self.complete_todoist_tasks(
+            [todoist_id for _, todoist_id, _ in tasks_to_clean if todoist_id]
+        )
+        completed_count = len(completed_ids)
+        tasks_to_clean = [
+            (gtasks_id, todoist_id if todoist_id in completed_ids else None, gtask)
+            for gtasks_id, todoist_id, gtask in tasks_to_clean
+        ]
         
         # Clean up completed tasks with mappings
         for gtasks_id, todoist_id, gtask in tasks_to_clean:
-            try:
-                # Remove from mappings since the Google Task is completed
-                if gtasks_id in self.mappings['gtasks_to_todoist']:
-                    del self.mappings['gtasks_to_todoist'][gtasks_id]
-                # Only remove Todoist mapping if we actually completed the Todoist task
-                if todoist_id and todoist_id in self.mappings['todoist_to_gtasks']:
-                    del self.mappings['todoist_to_gtasks'][todoist_id]
-                
-                # Delete the completed Google Task to keep things clean
-                self.gtasks.tasks().delete(tasklist=list_id, task=gtasks_id).execute()
-                if self.verbose:
-                    status = "and completed Todoist task" if todoist_id else "but skipped Todoist completion due to date mismatch"
-                    logger.info(f"  Cleaned up completed Google Task {status}: {gtask.get('title', 'Untitled')}")
-
-                status_msg = "and corresponding Todoist task" if todoist_id else "(Todoist completion skipped due to date mismatch)"
-                logger.info(f"Cleaned up completed Google Task {status_msg}: {gtask.get('title', 'Untitled')}")
-            except Exception as e:
-                logger.warning(f"Could not delete completed Google Task {gtask.get('title', 'Untitled')}: {e}")
+            # Remove from mappings since the Google Task is completed
+            if gtasks_id in self.mappings['gtasks_to_todoist']:
+                del self.mappings['gtasks_to_todoist'][gtasks_id]
+            # Only remove Todoist mapping if we actually completed the Todoist task
+            if todoist_id and todoist_id in self.mappings['todoist_to_gtasks']:
+                del self.mappings['todoist_to_gtasks'][todoist_id]
+                self._forget_version(todoist_id)
         
-        # Clean up orphaned completed tasks (these have no mapping)
-        for gtasks_id, gtask in orphaned_completed_tasks:
-            try:
-                self.gtasks.tasks().delete(tasklist=list_id, task=gtasks_id).execute()
+        # Delete the completed Google Tasks (mapped and orphaned) to keep things clean
+        cleanup = {gtasks_id: (todoist_id, gtask) for gtasks_id, todoist_id, gtask in tasks_to_clean}
+        orphaned = {gtasks_id: gtask for gtasks_id, gtask in orphaned_completed_tasks}
+        
+        def on_delete(gtasks_id, response, exception):
+            if gtasks_id in orphaned:
+                title = orphaned[gtasks_id].get('title', 'Untitled')
+                if exception is not None:
+                    logger.warning(f"Could not delete orphaned completed Google Task {title}: {exception}")
+                    return
                 if self.verbose:
-                    logger.info(f"  Cleaned up orphaned completed Google Task: {gtask.get('title', 'Untitled')}")
-                logger.info(f"Cleaned up orphaned completed Google Task: {gtask.get('title', 'Untitled')}")
-            except Exception as e:
-                logger.warning(f"Could not delete orphaned completed Google Task {gtask.get('title', 'Untitled')}: {e}")
+                    logger.info(f"  Cleaned up orphaned completed Google Task: {title}")
+                logger.info(f"Cleaned up orphaned completed Google Task: {title}")
+                return
+            
+            todoist_id, gtask = cleanup[gtasks_id]
+            title = gtask.get('title', 'Untitled')
+            if exception is not None:
+                logger.warning(f"Could not delete completed Google Task {title}: {exception}")
+                return
+            if self.verbose:
+                status = "and completed Todoist task" if todoist_id else "but did not complete the Todoist task"
+                logger.info(f"  Cleaned up completed Google Task {status}: {title}")
+            
+            status_msg = "and corresponding Todoist task" if todoist_id else "(Todoist task not completed)"
+            logger.info(f"Cleaned up completed Google Task {status_msg}: {title}")
+        
+        tasks_resource = self.gtasks.tasks()
+        deletes = [
+            (gtasks_id, tasks_resource.delete(tasklist=list_id, task=gtasks_id))
+            for gtasks_id in list(cleanup) + list(orphaned)
+        ]
+        try:
+            self._execute_batched(deletes, on_delete)
+        except Exception as e:
+            logger.warning(f"Could not delete completed Google Tasks: {e}")
         
         if completed_count > 0:
             logger.info(f"Completed {completed_count} Todoist tasks based on Google Tasks")
@@ -985,6 +1168,10 @@ sync_interval_minutes = 15
             if self.verbose:
                 logger.info("No completed Google Tasks found")
             
+        # Advance the cursor only once the completions have been processed
+        if not fetch_failed:
+            self.mappings['completions_checked_at'] = (scan_started - SCAN_OVERLAP).isoformat()
+        
         # Debug: Show current mappings after completion check
         if self.verbose:
             logger.info(f"Mappings after completion check: {len(self.mappings['gtasks_to_todoist'])} Google->Todoist, {len(self.mappings['todoist_to_gtasks'])} Todoist->Google")
@@ -995,6 +1182,10 @@ sync_interval_minutes = 15
         logger.info("Starting full synchronization cycle")
         logger.info("=" * 50)
         
+        # Fetch Todoist tasks afresh each cycle
+        self._todoist_tasks = None
+        self._todoist_task_cache = {}
+        
         try:
             # Check for completions FIRST, before syncing tasks
             # This prevents the race condition where completed tasks get recreated
@@ -1003,13 +1194,19 @@ sync_interval_minutes = 15
             # Then sync tasks from Todoist to Google Tasks
             self.sync_todoist_to_gtasks()
             
-            # Save mappings
-            self.save_mappings()
-            
             logger.info("Synchronization completed successfully")
             
         except Exception as e:
             logger.error(f"Error during synchronization: {e}")
+        
+        finally:
+            # Save mappings even after an error, so tasks already created are
+            # not created again on the next run
+            try:
+                self.save_mappings()
+                self.save_todoist_cache()
+            except Exception as e:
+                logger.error(f"Error saving mappings: {e}")
     
     def run_continuous_sync(self):
         """Run continuous synchronization with specified interval."""
@@ -1017,13 +1214,23 @@ sync_interval_minutes = 15
         logger.info(f"Starting continuous sync with {interval} minute intervals")
         logger.info("Press Ctrl+C to stop")
         
+        # SIGTERM (systemd, docker stop) ends the wait at once; a sync in
+        # progress finishes and saves its mappings first
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+        
         try:
-            while True:
+            while not stop.is_set():
                 self.full_sync()
+                if stop.is_set():
+                    break
                 logger.info(f"Waiting {interval} minutes until next sync...")
-                time.sleep(interval * 60)
+                stop.wait(interval * 60)
         except KeyboardInterrupt:
             logger.info("Synchronization stopped by user")
+        
+        if stop.is_set():
+            logger.info("Synchronization stopped by SIGTERM")
 
 
 def main():
@@ -1039,17 +1246,14 @@ def main():
     
     # Set logging level based on verbose flag
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        logger.setLevel(logging.DEBUG)
         logger.info("Verbose logging enabled")
     
     # Create sync manager
     try:
         sync_manager = TaskSyncManager(args.config, verbose=args.verbose)
     except Exception as e:
-        logger.error(f"Failed to initialize sync manager: {e}")
-        if args.verbose:
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error(f"Failed to initialize sync manager: {e}", exc_info=args.verbose)
         return 1
     
     # Check if configuration is complete
@@ -15,10 +15,17 @@ Setup:
 3. Configure sync settings in project_sync_config.json
 """
 
+import hashlib
+import json
 import os
 import logging
+import random
 import sys
 import re
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Tuple
 import time
@@ -26,11 +33,21 @@ import time
 from confparser import load_config, create_default_config
 
 # Third-party imports
+import google_auth_httplib2
+import httplib2
+import requests
 from todoist_api_python.api import TodoistAPI
+from todoist_api_python.models import Project, Task
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+# orjson is optional: much faster for large mapping files, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging with custom handlers
 class StdoutHandler(logging.StreamHandler):
@@ -72,6 +89,137 @@ logger.addHandler(stderr_handler)
 # Prevent duplicate messages from root logger
 logger.propagate = False
 
+# Google caps HTTP batch requests at 100 calls
+BATCH_SIZE = 100
+
+# Seconds before a stalled Google Tasks connection is given up on
+HTTP_TIMEOUT = 60
+
+# Google Tasks list page size (the API maximum) and the fields sync needs
+PAGE_SIZE = 100
+TASK_FIELDS = 'nextPageToken,items(id,title,notes,due,updated,etag)'
+
+# Time part Google Tasks stores for date-only due dates
+DATE_SUFFIX = "T00:00:00.000Z"
+
+TODOIST_SYNC_URL = "https://api.todoist.com/api/v1/sync"
+
+# Rate-limit and server errors worth retrying, and how often to retry them
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+
+# Todoist allows 450 requests per 15 minutes: pace at that rate, allowing short bursts
+TODOIST_REQUEST_RATE = 450 / (15 * 60)
+TODOIST_REQUEST_BURST = 30
+
+# inbox_list_name written by earlier config templates, when the setting had no
+# effect and inbox tasks synced to a list named after the Inbox project
+LEGACY_INBOX_LIST_NAME = "Todoist Inbox"
+
+
+@dataclass(frozen=True)
+class InboxProject:
+    """Stand-in project for Todoist's Inbox, synced to the list called name."""
+    name: str
+    # Name of Todoist's Inbox project; --project and excluded_projects match it too
+    project_name: str = 'Inbox'
+    id: str = 'inbox'
+    is_inbox: bool = True
+
+
+class TokenBucket:
+    """Thread-safe token bucket pacing requests to a sustained rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is the wait this caller owes; later callers queue behind it
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def _error_status(exception) -> Optional[int]:
+    """HTTP status of a Google or Todoist API error, or None if there is none."""
+    if isinstance(exception, HttpError):
+        return exception.resp.status
+    response = getattr(exception, 'response', None)
+    return getattr(response, 'status_code', None)
+
+
+def _retry_after(exception) -> Optional[float]:
+    """Seconds to wait from the error's Retry-After header, if it sent one in seconds."""
+    if isinstance(exception, HttpError):
+        value = exception.resp.get('retry-after')
+    else:
+        response = getattr(exception, 'response', None)
+        value = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _call_with_retries(func, bucket: Optional[TokenBucket] = None):
+    """Call func(), retrying rate-limit and server errors and dropped connections.
+
+    Waits as long as the Retry-After header asks, or otherwise
+    min(60, 2 ** attempt) seconds plus jitter, for up to MAX_RETRIES retries.
+    If a bucket is given, every attempt first takes a token from it.
+    The last error is raised to the caller.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            return func()
+        except (HttpError, requests.RequestException) as e:
+            transient = (_error_status(e) in RETRYABLE_STATUSES
+                         or isinstance(e, (requests.ConnectionError, requests.Timeout)))
+            if not transient or attempt == MAX_RETRIES:
+                raise
+            delay = _retry_after(e) or min(60, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning(f"API request failed ({e}), retrying in {delay:.0f} seconds")
+            time.sleep(delay)
+
+
+def _json_loads(data: bytes):
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to a fsynced temporary file and swap it in with os.replace.
+
+    A crash mid-write never leaves a truncated file behind.
+    """
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
 
 class ProjectSyncManager:
     """Manages one-way synchronization from Todoist projects to Google Tasks lists."""
@@ -81,15 +229,32 @@ class ProjectSyncManager:
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_file = os.path.join(script_dir, config_file) if not os.path.isabs(config_file) else config_file
         self.mapping_file = os.path.join(script_dir, "todoist-to-gtasks-mappings.json")
+        self.todoist_cache_file = os.path.join(script_dir, "todoist-to-gtasks-sync-cache.json")
+        self.http_cache_dir = os.path.join(script_dir, ".todoist-to-gtasks-cache")
         self.verbose = verbose
         self.dry_run = dry_run
         self.limit = limit
         self.single_project = single_project
+        self._gtasks_lists_by_title: Optional[Dict[str, str]] = None
+        self._inbox_id: Optional[str] = None
+        # Active Todoist projects, sections and tasks, loaded once per sync
+        self._projects: Optional[List] = None
+        self._sections_by_project: Optional[Dict[str, Dict[str, str]]] = None  # project ID -> section ID -> name
+        self._tasks_by_project: Optional[Dict[str, List]] = None
         self.load_config()
+        self.load_mappings()
+        self.load_todoist_cache()
 
-        # Initialize APIs
+        # Initialize APIs; the Google Tasks client is built on first use
         self.todoist = TodoistAPI(self.config['todoist_token'])
-        self.gtasks = self._init_google_tasks()
+        # Shared by all threads making Todoist requests
+        self._todoist_bucket = TokenBucket(TODOIST_REQUEST_RATE, TODOIST_REQUEST_BURST)
+        self._gtasks = None
+        self._tasks_resource = None
+        self._creds = None
+        self._token_hash: Optional[str] = None
+        # Per-thread HTTP clients for parallel list fetches
+        self._thread_local = threading.local()
 
         if self.dry_run:
             logger.info("DRY-RUN MODE: No changes will be made")
@@ -116,8 +281,13 @@ excluded_projects =
 # How often to sync in daemon mode (minutes)
 sync_interval_minutes = 15
 
-# Name for the Google Tasks list that receives inbox tasks
-inbox_list_name = Todoist Inbox
+# Name for the Google Tasks list that receives inbox tasks (optional;
+# empty keeps the Todoist Inbox project's own name, and changing it
+# moves inbox tasks to a new list)
+inbox_list_name =
+
+# Number of Todoist projects fetched in parallel
+fetch_concurrency = 8
 """
 
         defaults = {
@@ -126,7 +296,8 @@ inbox_list_name = Todoist Inbox
             'google_token_file': 'token.json',
             'excluded_projects': [],
             'sync_interval_minutes': 15,
-            'inbox_list_name': 'Todoist Inbox'
+            'inbox_list_name': '',
+            'fetch_concurrency': 8
         }
 
         if not os.path.exists(self.config_file):
@@ -152,6 +323,101 @@ inbox_list_name = Todoist Inbox
             else:
                 self.config['excluded_projects'] = []
 
+        # Configs generated from the old template name a list that was never
+        # synced to; keep the inbox tasks in the list they already live in
+        if self.config.get('inbox_list_name') == LEGACY_INBOX_LIST_NAME:
+            logger.info(f"Ignoring legacy inbox_list_name '{LEGACY_INBOX_LIST_NAME}', "
+                        "syncing inbox tasks to the Inbox project's own list")
+            self.config['inbox_list_name'] = ''
+
+    def load_mappings(self):
+        """Load task ID mappings between platforms."""
+        if os.path.exists(self.mapping_file):
+            with open(self.mapping_file, 'rb') as f:
+                self.mappings = _json_loads(f.read())
+            self._saved_digest = self._mappings_digest()
+        else:
+            self.mappings = {
+                "todoist_to_gtasks": {},  # todoist_id -> gtasks_id
+                "last_sync": None
+            }
+            self._saved_digest = None
+        # The reverse index is never read; drop it from older files on the next save
+        self.mappings.pop("gtasks_to_todoist", None)
+        # todoist_id -> hash of the list ID and task body last written to Google Tasks
+        self.mappings.setdefault("task_hashes", {})
+        # todoist_id -> Todoist updated_at of the task when last written or verified
+        self.mappings.setdefault("task_versions", {})
+
+    @staticmethod
+    def _task_version(todoist_task) -> Optional[str]:
+        """Todoist's updated_at of a task as a string, or None if not available."""
+        updated_at = getattr(todoist_task, 'updated_at', None)
+        return str(updated_at) if updated_at else None
+
+    def _record_task_version(self, task_id: str, version: Optional[str]):
+        """Remember the Todoist version of a task written to Google Tasks."""
+        if version:
+            self.mappings['task_versions'][task_id] = version
+        else:
+            self.mappings['task_versions'].pop(task_id, None)
+
+    def _mappings_digest(self) -> bytes:
+        """Digest of the mappings, ignoring the last_sync timestamp."""
+        state = {key: value for key, value in self.mappings.items() if key != 'last_sync'}
+        return hashlib.blake2b(_json_dumps(state), digest_size=16).digest()
+
+    def save_mappings(self):
+        """Save task ID mappings to file if they changed since the last load or save."""
+        self.mappings["last_sync"] = datetime.now(timezone.utc).isoformat()
+
+        digest = self._mappings_digest()
+        if digest == self._saved_digest:
+            if self.verbose:
+                logger.info("Mappings unchanged, not saving")
+            return
+
+        _write_atomic(self.mapping_file, _json_dumps(self.mappings))
+        self._saved_digest = digest
+
+    def load_todoist_cache(self):
+        """Load the Todoist Sync API token and the projects, sections and items fetched with it.
+
+        They are kept apart from the mappings, which only hold ID pairs and
+        per-task state. Files written before the split have part of them in
+        the mappings; those keys are dropped on the next save and the first
+        sync is a full one.
+        """
+        for key in ('todoist_sync_token', 'todoist_projects', 'todoist_sections', 'todoist_items'):
+            self.mappings.pop(key, None)
+        if os.path.exists(self.todoist_cache_file):
+            with open(self.todoist_cache_file, 'rb') as f:
+                self.todoist_cache = _json_loads(f.read())
+        else:
+            self.todoist_cache = {}
+        self._todoist_cache_dirty = False
+
+    def save_todoist_cache(self):
+        """Save the Todoist sync token and cached objects to file if they changed."""
+        if not self._todoist_cache_dirty:
+            return
+        _write_atomic(self.todoist_cache_file, _json_dumps(self.todoist_cache))
+        self._todoist_cache_dirty = False
+
+    @property
+    def gtasks(self):
+        """Google Tasks API client, authorized and built on first access."""
+        if self._gtasks is None:
+            self._gtasks = self._init_google_tasks()
+        return self._gtasks
+
+    @property
+    def tasks_resource(self):
+        """The client's tasks() resource, built once instead of for every queued request."""
+        if self._tasks_resource is None:
+            self._tasks_resource = self.gtasks.tasks()
+        return self._tasks_resource
+
     def _init_google_tasks(self):
         """Initialize Google Tasks API client."""
         SCOPES = ['https://www.googleapis.com/auth/tasks']
@@ -162,6 +428,7 @@ inbox_list_name = Todoist Inbox
         # Load existing credentials
         if os.path.exists(token_file):
             creds = Credentials.from_authorized_user_file(token_file, SCOPES)
+            self._token_hash = self._credentials_hash(creds)
 
         # Refresh or get new credentials
         if not creds or not creds.valid:
@@ -174,34 +441,113 @@ inbox_list_name = Todoist Inbox
                         "Please download from Google Cloud Console."
                     )
 
+                # Only needed for the first authorization; pulls in requests_oauthlib
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.config['google_credentials_file'], SCOPES
                 )
                 creds = flow.run_local_server(port=0)
 
-            # Save credentials
-            with open(token_file, 'w') as token:
-                token.write(creds.to_json())
+            self._save_token(creds)
+
+        self._creds = creds
+        # Use the discovery document bundled with google-api-python-client
+        # instead of fetching it over HTTPS on every start
+        return build('tasks', 'v1', http=google_auth_httplib2.AuthorizedHttp(creds, http=self._new_http()),
+                     static_discovery=True, cache_discovery=False)
+
+    def _new_http(self) -> httplib2.Http:
+        """Create an httplib2 client for Google Tasks requests.
+
+        Each client keeps its connection to Google open between requests.
+        httplib2's file cache stores list responses with their ETag and
+        revalidates them with If-None-Match, so unchanged pages come back as
+        a bodiless 304.
+        """
+        return httplib2.Http(cache=self.http_cache_dir, timeout=HTTP_TIMEOUT)
 
-        return build('tasks', 'v1', credentials=creds)
+    @staticmethod
+    def _credentials_hash(creds: Credentials) -> str:
+        """Return a hash of the serialized credentials."""
+        return hashlib.sha256(creds.to_json().encode('utf-8')).hexdigest()
+
+    def _save_token(self, creds: Credentials):
+        """Write credentials to the token file if they changed.
+
+        The token is written to a temporary file of this process and swapped
+        in with os.replace, so other instances sharing the token file never
+        read a partial token.
+        """
+        token_hash = self._credentials_hash(creds)
+        if token_hash == self._token_hash:
+            return
+
+        token_file = self.config['google_token_file']
+        tmp_file = f"{token_file}.{os.getpid()}.tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(creds.to_json())
+            token.flush()
+            os.fsync(token.fileno())
+        os.replace(tmp_file, token_file)
+        self._token_hash = token_hash
+
+    def _refresh_credentials(self):
+        """Refresh expired credentials and persist tokens refreshed in memory.
+
+        The API client refreshes access tokens by itself but never writes them
+        back, so each sync cycle checks first. Does nothing until the
+        Google client has been built.
+        """
+        if self._creds is None:
+            return
+        if self._creds.expired and self._creds.refresh_token:
+            self._creds.refresh(Request())
+        self._save_token(self._creds)
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP client owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so worker threads must not
+        share the HTTP client of the discovery-built service.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._creds, http=self._new_http())
+            self._thread_local.http = http
+        return http
 
     def get_todoist_projects(self) -> List:
-        """Get all Todoist projects including inbox."""
+        """Get all Todoist projects including inbox.
+
+        Served from the projects loaded by load_todoist_data() when available,
+        otherwise fetched through the REST API.
+        """
         try:
-            # get_projects() returns a paginator that yields lists of projects
-            projects_paginator = self.todoist.get_projects()
+            if self._projects is not None:
+                all_todoist_projects = self._projects
+            else:
+                # get_projects() returns a paginator that yields lists of projects
+                all_todoist_projects = []
+                for page in _call_with_retries(lambda: list(self.todoist.get_projects()), self._todoist_bucket):
+                    all_todoist_projects.extend(page)
 
-            # Collect all projects from paginator
+            # Set aside Todoist's own Inbox project so its tasks are only
+            # synced through the entry below
             projects = []
-            for page in projects_paginator:
-                projects.extend(page)
+            inbox_name = 'Inbox'
+            for project in all_todoist_projects:
+                if getattr(project, 'is_inbox_project', False):
+                    self._inbox_id = str(project.id)
+                    inbox_name = project.name
+                else:
+                    projects.append(project)
 
-            # Add special "Inbox" project (represented by project_id=None in tasks)
-            inbox_project = type('obj', (object,), {
-                'id': 'inbox',
-                'name': self.config.get('inbox_list_name', 'Todoist Inbox'),
-                'is_inbox': True
-            })()
+            # Add special "Inbox" project, synced to the inbox_list_name list
+            # or else to a list named after the Inbox project, as before
+            inbox_project = InboxProject(
+                name=self.config.get('inbox_list_name') or inbox_name, project_name=inbox_name)
 
             all_projects = [inbox_project] + projects
 
@@ -212,60 +558,172 @@ inbox_list_name = Todoist Inbox
 
             return all_projects
         except Exception as e:
-            logger.error(f"Error fetching Todoist projects: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error fetching Todoist projects: {e}", exc_info=self.verbose)
             return []
 
-    def get_todoist_tasks_by_project(self, project_id: str) -> List:
-        """Get all tasks from a specific Todoist project."""
+    @staticmethod
+    def _merge_sync_resource(cache: Dict, changed: List, is_gone) -> Dict:
+        """Apply the changed objects of one Sync API resource type to its cache."""
+        for obj in changed:
+            if is_gone(obj):
+                cache.pop(obj['id'], None)
+            else:
+                cache[obj['id']] = obj
+        return cache
+
+    def _sync_todoist(self) -> Tuple[Dict, Dict, Dict]:
+        """Bring the cached Todoist projects, sections and items up to date.
+
+        All three are fetched with a single Sync API call. The first call (sync
+        token '*') returns every object; later calls return only the objects
+        changed since the stored sync token, which are merged into the caches.
+        Deleted and archived projects and sections, and completed and deleted
+        items, are dropped from them.
+
+        Returns:
+            Tuple of dictionaries mapping todoist_id -> raw project, section and item
+        """
+        sync_token = self.todoist_cache.get('sync_token') or '*'
+
+        def post_sync():
+            response = requests.post(
+                TODOIST_SYNC_URL,
+                headers={'Authorization': f"Bearer {self.config['todoist_token']}"},
+                data={'sync_token': sync_token, 'resource_types': '["projects","sections","items"]'},
+                timeout=60
+            )
+            response.raise_for_status()
+            return response.json()
+
+        result = _call_with_retries(post_sync, self._todoist_bucket)
+
+        full_sync = result.get('full_sync', sync_token == '*')
+        if self.verbose:
+            sync_type = "full" if full_sync else "incremental"
+            logger.info(f"Todoist {sync_type} sync returned {len(result.get('projects', []))} project(s), "
+                        f"{len(result.get('sections', []))} section(s) and {len(result.get('items', []))} item(s)")
+
+        def container_gone(obj):
+            return obj.get('is_deleted') or obj.get('is_archived')
+
+        def item_gone(obj):
+            return obj.get('is_deleted') or obj.get('checked')
+
+        def cached(key):
+            return {} if full_sync else self.todoist_cache.get(key, {})
+
+        projects = self._merge_sync_resource(cached('projects'), result.get('projects', []), container_gone)
+        sections = self._merge_sync_resource(cached('sections'), result.get('sections', []), container_gone)
+        items = self._merge_sync_resource(cached('items'), result.get('items', []), item_gone)
+
+        self.todoist_cache = {
+            'sync_token': result['sync_token'],
+            'projects': projects,
+            'sections': sections,
+            'items': items,
+        }
+        self._todoist_cache_dirty = True
+        return projects, sections, items
+
+    def load_todoist_data(self):
+        """Fetch all active Todoist projects, sections and tasks once per sync.
+
+        Tasks are grouped by project ID and section names by project ID, so the
+        per-project getters become lookups. If the Sync API call fails, all
+        tasks are fetched once through the REST API instead, projects and
+        sections are left to the getters' REST fallbacks, and the next run
+        starts with a full sync.
+        """
+        self._projects = None
+        self._sections_by_project = None
+        self._tasks_by_project = None
         try:
-            if project_id == 'inbox':
-                # Get tasks with no project (inbox tasks)
+            projects, sections, items = self._sync_todoist()
+            all_tasks = [Task.from_dict(item) for item in items.values()]
+        except Exception as e:
+            logger.warning(f"Todoist incremental sync failed, fetching all tasks: {e}")
+            self.todoist_cache = {}
+            self._todoist_cache_dirty = True
+            try:
                 all_tasks = []
-                tasks_paginator = self.todoist.get_tasks()
-                for page in tasks_paginator:
+                for page in _call_with_retries(lambda: list(self.todoist.get_tasks()), self._todoist_bucket):
                     all_tasks.extend(page)
+            except Exception as e:
+                logger.error(f"Error fetching Todoist tasks: {e}")
+                return
+        else:
+            ordered = sorted(projects.values(), key=lambda project: project.get('child_order') or 0)
+            self._projects = [Project.from_dict(project) for project in ordered]
+            sections_by_project = {}
+            for section in sorted(sections.values(), key=lambda section: section.get('section_order') or 0):
+                sections_by_project.setdefault(str(section['project_id']), {})[str(section['id'])] = section['name']
+            self._sections_by_project = sections_by_project
+
+        tasks_by_project = {}
+        for task in all_tasks:
+            tasks_by_project.setdefault(str(task.project_id), []).append(task)
+        self._tasks_by_project = tasks_by_project
 
-                # Filter for tasks with no project_id
-                inbox_tasks = [t for t in all_tasks if not hasattr(t, 'project_id') or not t.project_id]
-
-                if self.verbose:
-                    logger.info(f"Found {len(inbox_tasks)} tasks in inbox")
+    def get_todoist_tasks_by_project(self, project_id: str) -> List:
+        """Get all tasks from a specific Todoist project.
 
-                return inbox_tasks
+        Served from the tasks loaded by load_todoist_data() when available,
+        otherwise fetched through the REST API.
+        """
+        try:
+            is_inbox = project_id == 'inbox'
+            if is_inbox:
+                # Get the tasks of Todoist's Inbox project, found by get_todoist_projects()
+                if not self._inbox_id:
+                    logger.warning("Todoist Inbox project not found, skipping inbox tasks")
+                    return []
+                project_id = self._inbox_id
+
+            if self._tasks_by_project is not None:
+                tasks = list(self._tasks_by_project.get(project_id, []))
             else:
-                # Get tasks for specific project
                 tasks = []
-                tasks_paginator = self.todoist.get_tasks(project_id=project_id)
+                tasks_paginator = _call_with_retries(
+                    lambda: list(self.todoist.get_tasks(project_id=project_id)), self._todoist_bucket)
                 for page in tasks_paginator:
                     tasks.extend(page)
 
-                if self.verbose:
+            if self.verbose:
+                if is_inbox:
+                    logger.info(f"Found {len(tasks)} tasks in inbox")
+                else:
                     logger.info(f"Found {len(tasks)} tasks in project {project_id}")
 
-                return tasks
+            return tasks
         except Exception as e:
-            logger.error(f"Error fetching tasks for project {project_id}: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error fetching tasks for project {project_id}: {e}", exc_info=self.verbose)
             return []
 
+    def _ensure_lists_cache(self) -> Dict[str, str]:
+        """Fetch all Google Tasks lists once per sync, indexed as title -> list ID."""
+        if self._gtasks_lists_by_title is None:
+            lists_by_title = {}
+            page_token = None
+            while True:
+                request = self.gtasks.tasklists().list(maxResults=100, pageToken=page_token)
+                results = _call_with_retries(request.execute)
+                for task_list in results.get('items', []):
+                    lists_by_title.setdefault(task_list['title'], task_list['id'])
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+            self._gtasks_lists_by_title = lists_by_title
+        return self._gtasks_lists_by_title
+
     def find_or_create_gtasks_list(self, project_name: str) -> Optional[str]:
         """Find existing Google Tasks list or create new one matching Todoist project."""
         try:
             # Search for existing list by name
-            results = self.gtasks.tasklists().list().execute()
-            lists = results.get('items', [])
-
-            for task_list in lists:
-                if task_list['title'] == project_name:
-                    list_id = task_list['id']
-                    if self.verbose:
-                        logger.info(f"Found existing list '{project_name}': {list_id}")
-                    return list_id
+            list_id = self._ensure_lists_cache().get(project_name)
+            if list_id:
+                if self.verbose:
+                    logger.info(f"Found existing list '{project_name}': {list_id}")
+                return list_id
 
             # Create new list
             if self.dry_run:
@@ -273,70 +731,103 @@ inbox_list_name = Todoist Inbox
                 # Return a fake ID for dry-run
                 return f"dry_run_list_{project_name}"
 
-            new_list = self.gtasks.tasklists().insert(body={'title': project_name}).execute()
+            new_list = _call_with_retries(self.gtasks.tasklists().insert(body={'title': project_name}).execute)
             list_id = new_list['id']
+            self._gtasks_lists_by_title[project_name] = list_id
             logger.info(f"Created new Google Tasks list: '{project_name}' (ID: {list_id})")
 
             return list_id
 
         except Exception as e:
-            logger.error(f"Error finding/creating Google Tasks list for project '{project_name}': {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error finding/creating Google Tasks list for project '{project_name}': {e}", exc_info=self.verbose)
             return None
 
     def get_gtasks_in_list(self, list_id: str) -> Dict[str, Dict]:
-        """Get all tasks in a Google Tasks list, indexed by title."""
+        """Get all tasks in a Google Tasks list, indexed by Google Task ID.
+
+        Safe to call from worker threads: the request runs on the calling
+        thread's own HTTP client.
+        """
         try:
-            result = self.gtasks.tasks().list(
-                tasklist=list_id,
-                showCompleted=True,
-                showHidden=True
-            ).execute()
-
-            tasks = result.get('items', [])
-            # Index by title for easy lookup
-            return {task['title']: task for task in tasks}
+            tasks_resource = self.gtasks.tasks()
+            http = self._thread_http()
+            tasks = []
+            page_token = None
+            while True:
+                request = tasks_resource.list(
+                    tasklist=list_id,
+                    showCompleted=True,
+                    showHidden=True,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=TASK_FIELDS
+                )
+                result = _call_with_retries(lambda: request.execute(http=http))
+                tasks.extend(result.get('items', []))
+                page_token = result.get('nextPageToken')
+                if not page_token:
+                    break
+
+            return {task['id']: task for task in tasks}
         except Exception as e:
             logger.error(f"Error fetching Google Tasks from list {list_id}: {e}")
             return {}
 
-    def sync_task_to_gtasks(self, todoist_task, list_id: str, existing_gtasks: Dict[str, Dict]) -> bool:
+    def sync_task_to_gtasks(self, todoist_task, list_id: str, existing_gtasks: Dict[str, Dict],
+                            gtasks_by_title: Dict[str, Dict], pending: List[Tuple[str, object, str, object]]) -> bool:
         """
-        Sync a Todoist task to Google Tasks (create or update).
-        Returns True if successful, False otherwise.
+        Queue the Google Tasks insert or update for a Todoist task.
+
+        The Google Task is found through the stored todoist_to_gtasks mapping
+        in `existing_gtasks` (ID -> task), so renamed tasks are updated in
+        place. Tasks without a mapped Google Task in the list fall back to a
+        title match in `gtasks_by_title`, which holds only unmapped Google Tasks.
+
+        The request is appended to `pending` as (request_id, todoist_task,
+        body_hash, HttpRequest) and sent later by execute_gtasks_requests().
+        Tasks whose updated_at matches the version last written to their mapped
+        Google Task are skipped before building the body; updates whose body
+        hash matches the one last written are skipped as well.
+        Returns True if the task was queued (or logged in dry-run), False otherwise.
         """
         try:
-            # Prepare task notes - start with recurrence if present
-            notes = ""
-
-            # Check for recurrence and prepend raw due.string
-            if hasattr(todoist_task, 'due') and todoist_task.due:
-                if hasattr(todoist_task.due, 'is_recurring') and todoist_task.due.is_recurring:
-                    due_string = getattr(todoist_task.due, 'string', '')
-                    if due_string:
-                        notes = due_string
-                        if self.verbose:
-                            logger.info(f"Added recurrence string: {due_string}")
-
-            # Add task description if present
-            if hasattr(todoist_task, 'description') and todoist_task.description:
-                if notes:
-                    notes += f"\n\n{todoist_task.description}"
-                else:
-                    notes = todoist_task.description
+            task_id = str(todoist_task.id)
+            version = self._task_version(todoist_task)
+            mapped_id = self.mappings['todoist_to_gtasks'].get(task_id)
+            existing_task = existing_gtasks.get(mapped_id) if mapped_id else None
+            if (version and existing_task
+                    and self.mappings['task_versions'].get(task_id) == version):
+                if self.verbose:
+                    logger.info(f"Not modified since last sync, skipping: '{todoist_task.content}'")
+                return True
+
+            due = getattr(todoist_task, 'due', None)
+            description = getattr(todoist_task, 'description', None) or ''
+
+            # Prepare task notes - the raw due.string if recurring, then the description
+            notes_parts = []
+            if due and getattr(due, 'is_recurring', False):
+                due_string = getattr(due, 'string', None)
+                if due_string:
+                    notes_parts.append(due_string)
+                    if self.verbose:
+                        logger.info(f"Added recurrence string: {due_string}")
+            if description:
+                notes_parts.append(description)
+            notes = "\n\n".join(notes_parts)
 
             # Handle due date
             due_date_for_gtask = None
-            if hasattr(todoist_task, 'due') and todoist_task.due:
-                if hasattr(todoist_task.due, 'datetime') and todoist_task.due.datetime:
-                    due_date_for_gtask = todoist_task.due.datetime
-                elif hasattr(todoist_task.due, 'date') and todoist_task.due.date:
-                    if isinstance(todoist_task.due.date, str):
-                        due_date_for_gtask = todoist_task.due.date + "T00:00:00.000Z"
+            if due:
+                due_datetime = getattr(due, 'datetime', None)
+                due_date = getattr(due, 'date', None)
+                if due_datetime:
+                    due_date_for_gtask = due_datetime
+                elif due_date:
+                    if isinstance(due_date, str):
+                        due_date_for_gtask = due_date + DATE_SUFFIX
                     else:
-                        due_date_for_gtask = todoist_task.due.date.strftime("%Y-%m-%dT00:00:00.000Z")
+                        due_date_for_gtask = f"{due_date.year:04d}-{due_date.month:02d}-{due_date.day:02d}{DATE_SUFFIX}"
 
             task_body = {
                 'title': todoist_task.content,
@@ -346,94 +837,191 @@ inbox_list_name = Todoist Inbox
             if due_date_for_gtask:
                 task_body['due'] = due_date_for_gtask
 
-            # Check if task already exists by title
-            if todoist_task.content in existing_gtasks:
-                existing_task = existing_gtasks[todoist_task.content]
+            body_hash = hashlib.blake2b(
+                json.dumps([list_id, task_body], sort_keys=True).encode('utf-8'), digest_size=16
+            ).hexdigest()
+
+            # Not mapped to a task in this list yet: claim an unmapped task with the same title
+            if existing_task is None:
+                existing_task = gtasks_by_title.pop(todoist_task.content, None)
+
+            if existing_task:
                 gtasks_id = existing_task['id']
 
+                # Skip the update if this exact body was last written to this same task
+                if mapped_id == gtasks_id and self.mappings['task_hashes'].get(task_id) == body_hash:
+                    self._record_task_version(task_id, version)
+                    if self.verbose:
+                        logger.info(f"Unchanged, skipping Google Task: '{todoist_task.content}'")
+                    return True
+
+                # Skip the update if the Google Task already has this content,
+                # remembering it as written so later runs take the checks above
+                if (existing_task.get('title') == task_body['title']
+                        and existing_task.get('notes', '') == task_body['notes']
+                        and existing_task.get('due') == task_body.get('due')):
+                    self.mappings['todoist_to_gtasks'][task_id] = gtasks_id
+                    self.mappings['task_hashes'][task_id] = body_hash
+                    self._record_task_version(task_id, version)
+                    if self.verbose:
+                        logger.info(f"Already up to date, skipping Google Task: '{todoist_task.content}'")
+                    return True
+
                 # Update existing task
                 if self.dry_run:
                     logger.info(f"[DRY-RUN] Would update Google Task: '{todoist_task.content}'")
                 else:
                     task_body['id'] = gtasks_id
-                    self.gtasks.tasks().update(
+                    request = self.tasks_resource.update(
                         tasklist=list_id,
                         task=gtasks_id,
                         body=task_body
-                    ).execute()
-
-                    if self.verbose:
-                        logger.info(f"Updated Google Task: '{todoist_task.content}'")
+                    )
+                    # Only overwrite the version listed above; if the task changed
+                    # since, the update fails and is retried on the next sync
+                    if existing_task.get('etag'):
+                        request.headers['If-Match'] = existing_task['etag']
+                    pending.append((task_id, todoist_task, body_hash, request))
             else:
                 # Create new task
                 if self.dry_run:
                     logger.info(f"[DRY-RUN] Would create Google Task: '{todoist_task.content}'")
                 else:
-                    result = self.gtasks.tasks().insert(
+                    pending.append((task_id, todoist_task, body_hash, self.tasks_resource.insert(
                         tasklist=list_id,
                         body=task_body
-                    ).execute()
-
-                    logger.info(f"Created Google Task: '{todoist_task.content}'")
+                    )))
 
             return True
 
         except Exception as e:
-            logger.error(f"Error syncing task '{todoist_task.content}': {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error syncing task '{todoist_task.content}': {e}", exc_info=self.verbose)
             return False
 
+    def execute_gtasks_requests(self, pending: List[Tuple[str, object, str, object]]) -> int:
+        """
+        Send queued Google Tasks requests as HTTP batches of at most BATCH_SIZE calls.
+
+        Requests failing with a rate-limit or server error are resent up to
+        MAX_RETRIES times, after an exponential backoff with jitter.
+        Returns the number of requests that failed.
+        """
+        tasks_by_id = {request_id: todoist_task for request_id, todoist_task, _, _ in pending}
+        hashes = {request_id: body_hash for request_id, _, body_hash, _ in pending}
+        # Inserts are POSTs; updates are PUTs to the task's own URI
+        created_ids = {request_id for request_id, _, _, request in pending if request.method == 'POST'}
+        failed = []
+        retry_ids = []
+        final_attempt = False
+
+        def on_result(request_id, response, exception):
+            if (not final_attempt and isinstance(exception, HttpError)
+                    and exception.resp.status in RETRYABLE_STATUSES):
+                retry_ids.append(request_id)
+                return
+            todoist_task = tasks_by_id[request_id]
+            if exception is not None:
+                logger.error(f"Error syncing task '{todoist_task.content}': {exception}")
+                self.mappings['task_versions'].pop(request_id, None)
+                failed.append(request_id)
+                return
+
+            self.mappings['todoist_to_gtasks'][request_id] = response['id']
+            self.mappings['task_hashes'][request_id] = hashes[request_id]
+            self._record_task_version(request_id, self._task_version(todoist_task))
+            if request_id in created_ids:
+                logger.info(f"Created Google Task: '{todoist_task.content}'")
+            elif self.verbose:
+                logger.info(f"Updated Google Task: '{todoist_task.content}'")
+
+        to_send = pending
+        for attempt in range(MAX_RETRIES + 1):
+            final_attempt = attempt == MAX_RETRIES
+            retry_ids.clear()
+
+            for start in range(0, len(to_send), BATCH_SIZE):
+                chunk = to_send[start:start + BATCH_SIZE]
+                batch = self.gtasks.new_batch_http_request(callback=on_result)
+                for request_id, _, _, request in chunk:
+                    batch.add(request, request_id=request_id)
+                try:
+                    batch.execute()
+                except Exception as e:
+                    logger.error(f"Error executing Google Tasks batch: {e}", exc_info=self.verbose)
+                    failed.extend(request_id for request_id, _, _, _ in chunk)
+
+            if not retry_ids:
+                break
+
+            delay = min(60, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning(f"Google Tasks API throttled {len(retry_ids)} request(s), retrying in {delay:.0f} seconds")
+            time.sleep(delay)
+            retry_set = set(retry_ids)
+            to_send = [entry for entry in pending if entry[0] in retry_set]
+
+        return len(failed)
+
     def get_project_sections(self, project_id: str) -> Dict[str, str]:
-        """Get all sections in a project, returning a dict of section_id -> section_name."""
+        """Get all sections in a project, returning a dict of section_id -> section_name.
+
+        Served from the sections loaded by load_todoist_data() when available,
+        otherwise fetched through the REST API.
+        """
         try:
             if project_id == 'inbox':
                 # Inbox doesn't have sections
                 return {}
 
-            # get_sections() returns a list, not a paginator
-            sections_list = self.todoist.get_sections(project_id=project_id)
-
-            # Handle both single list and paginated results
-            sections = []
-            if hasattr(sections_list, '__iter__'):
-                # Check if it's a paginator by trying to iterate
-                try:
-                    for item in sections_list:
-                        if isinstance(item, list):
-                            # It's paginated - item is a list of sections
-                            sections.extend(item)
-                        else:
-                            # It's a direct list - item is a section
-                            sections.append(item)
-                except:
-                    sections = list(sections_list)
-
-            sections_dict = {str(section.id): section.name for section in sections}
+            if self._sections_by_project is not None:
+                sections_dict = dict(self._sections_by_project.get(project_id, {}))
+            else:
+                # get_sections() returns a list or a paginator; materialize either
+                sections_list = _call_with_retries(
+                    lambda: list(self.todoist.get_sections(project_id=project_id)), self._todoist_bucket)
+
+                # Handle both single list and paginated results
+                sections = []
+                if hasattr(sections_list, '__iter__'):
+                    # Check if it's a paginator by trying to iterate
+                    try:
+                        for item in sections_list:
+                            if isinstance(item, list):
+                                # It's paginated - item is a list of sections
+                                sections.extend(item)
+                            else:
+                                # It's a direct list - item is a section
+                                sections.append(item)
+                    except:
+                        sections = list(sections_list)
+
+                sections_dict = {str(section.id): section.name for section in sections}
 
             if self.verbose and sections_dict:
                 logger.info(f"Found {len(sections_dict)} section(s): {list(sections_dict.values())}")
 
             return sections_dict
         except Exception as e:
-            logger.error(f"Error fetching sections for project {project_id}: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error fetching sections for project {project_id}: {e}", exc_info=self.verbose)
             return {}
 
+    @staticmethod
+    def _project_matches(project, names) -> bool:
+        """Whether a project is named in names; the inbox also answers to its Todoist project name."""
+        return project.name in names or getattr(project, 'project_name', None) in names
+
     def sync_all_projects(self):
         """Main sync loop: sync all Todoist projects to Google Tasks lists."""
         logger.info("Starting Todoist → Google Tasks project sync...")
+        self._gtasks_lists_by_title = None
 
-        # Get all projects
+        # Load all Todoist data in one request, then get all projects
+        self.load_todoist_data()
         projects = self.get_todoist_projects()
         excluded = self.config.get('excluded_projects', [])
 
         # Filter to single project if specified
         if self.single_project:
-            projects_to_sync = [p for p in projects if p.name == self.single_project]
+            projects_to_sync = [p for p in projects if self._project_matches(p, {self.single_project})]
             if not projects_to_sync:
                 logger.error(f"Project '{self.single_project}' not found")
                 logger.info(f"Available projects: {[p.name for p in projects]}")
@@ -441,27 +1029,29 @@ inbox_list_name = Todoist Inbox
             logger.info(f"Syncing single project: '{self.single_project}'")
         else:
             # Filter excluded projects
-            projects_to_sync = [p for p in projects if p.name not in excluded]
+            excluded_names = frozenset(excluded)
+            projects_to_sync = [p for p in projects if not self._project_matches(p, excluded_names)]
 
             if excluded:
                 logger.info(f"Excluding {len(excluded)} project(s): {excluded}")
 
             logger.info(f"Syncing {len(projects_to_sync)} project(s)")
 
-        total_tasks = 0
-        total_limit_reached = False
+        # Fetch sections and tasks of all projects in parallel, since the
+        # Todoist requests are independent of each other
+        def fetch_project(project):
+            project_id = str(project.id)
+            return self.get_project_sections(project_id), self.get_todoist_tasks_by_project(project_id)
 
-        for project in projects_to_sync:
-            logger.info(f"\nProcessing project: '{project.name}'")
+        workers = max(1, int(self.config.get('fetch_concurrency') or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(fetch_project, projects_to_sync))
 
-            # Get sections for this project
-            sections = self.get_project_sections(str(project.id))
-
-            # Get all tasks in this project
-            tasks = self.get_todoist_tasks_by_project(str(project.id))
+        # Group each project's tasks by section, giving one target list per section
+        section_work = []  # (list_name, section_tasks)
+        for project, (sections, tasks) in zip(projects_to_sync, fetched):
             logger.info(f"Found {len(tasks)} task(s) in project '{project.name}'")
 
-            # Group tasks by section
             tasks_by_section = {}  # section_id -> [tasks]
             for task in tasks:
                 section_id = getattr(task, 'section_id', None)
@@ -471,32 +1061,56 @@ inbox_list_name = Todoist Inbox
                     tasks_by_section[section_id_str] = []
                 tasks_by_section[section_id_str].append(task)
 
-            # Process each section (or no section)
             for section_id, section_tasks in tasks_by_section.items():
-                if total_limit_reached:
-                    break
-
                 # Determine list name
                 if section_id and section_id in sections:
                     list_name = f"{project.name} - {sections[section_id]}"
                 else:
                     list_name = project.name
+                section_work.append((list_name, section_tasks))
 
+        total_tasks = 0
+        total_limit_reached = False
+        # Google Tasks already mapped to a Todoist task are never matched by title
+        mapped_gtask_ids = set(self.mappings['todoist_to_gtasks'].values())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Find or create all lists up front on this thread, then fetch their
+            # existing tasks in parallel. With --limit, lists are only prepared
+            # once their section is reached, so no lists are created needlessly.
+            list_ids = {}  # list_name -> list_id (None if it could not be resolved)
+            existing_futures = {}  # list_id -> Future of get_gtasks_in_list
+            if not self.limit:
+                for list_name, _ in section_work:
+                    if list_name not in list_ids:
+                        list_ids[list_name] = self.find_or_create_gtasks_list(list_name)
+                for list_id in list_ids.values():
+                    if list_id and list_id not in existing_futures:
+                        existing_futures[list_id] = executor.submit(self.get_gtasks_in_list, list_id)
+
+            # Sync each section on this thread, in project order
+            for list_name, section_tasks in section_work:
                 if self.verbose:
                     logger.info(f"\nProcessing section: '{list_name}' ({len(section_tasks)} tasks)")
 
                 # Find or create corresponding Google Tasks list
-                list_id = self.find_or_create_gtasks_list(list_name)
+                if list_name not in list_ids:
+                    list_ids[list_name] = self.find_or_create_gtasks_list(list_name)
+                list_id = list_ids[list_name]
                 if not list_id:
                     logger.error(f"Could not get list ID for '{list_name}', skipping")
                     continue
 
                 # Get existing tasks in Google Tasks list
-                existing_gtasks = self.get_gtasks_in_list(list_id)
+                future = existing_futures.get(list_id)
+                existing_gtasks = future.result() if future else self.get_gtasks_in_list(list_id)
+                gtasks_by_title = {task['title']: task for task in existing_gtasks.values()
+                                   if task['id'] not in mapped_gtask_ids}
                 if self.verbose:
                     logger.info(f"Found {len(existing_gtasks)} existing Google Task(s) in list")
 
-                # Sync each task in this section
+                # Queue each task in this section, then send them in batches
+                pending = []
                 for task in section_tasks:
                     # Check limit
                     if self.limit and total_tasks >= self.limit:
@@ -504,12 +1118,14 @@ inbox_list_name = Todoist Inbox
                         total_limit_reached = True
                         break
 
-                    if self.sync_task_to_gtasks(task, list_id, existing_gtasks):
+                    if self.sync_task_to_gtasks(task, list_id, existing_gtasks, gtasks_by_title, pending):
                         total_tasks += 1
 
-            # Break outer loop if limit reached
-            if total_limit_reached:
-                break
+                if pending:
+                    total_tasks -= self.execute_gtasks_requests(pending)
+
+                if total_limit_reached:
+                    break
 
         status_msg = f"\nSync complete: {total_tasks} tasks processed"
         if total_limit_reached:
@@ -523,13 +1139,16 @@ inbox_list_name = Todoist Inbox
         logger.info("=" * 50)
 
         try:
+            # A failed token refresh only costs this cycle, not the daemon
+            self._refresh_credentials()
             self.sync_all_projects()
             logger.info("Synchronization completed successfully")
         except Exception as e:
-            logger.error(f"Error during synchronization: {e}")
-            if self.verbose:
-                import traceback
-                logger.error(f"Full traceback: {traceback.format_exc()}")
+            logger.error(f"Error during synchronization: {e}", exc_info=self.verbose)
+        finally:
+            if not self.dry_run:
+                self.save_mappings()
+                self.save_todoist_cache()
 
     def run_continuous_sync(self):
         """Run continuous synchronization with specified interval."""
@@ -537,14 +1156,42 @@ inbox_list_name = Todoist Inbox
         logger.info(f"Starting continuous sync with {interval} minute intervals")
         logger.info("Press Ctrl+C to stop")
 
+        # SIGTERM (systemd, docker stop) ends the wait at once; a sync in
+        # progress finishes and saves its mappings first. SIGHUP starts the
+        # next sync right away.
+        stop = threading.Event()
+        wake = threading.Event()
+
+        def on_sigterm(signum, frame):
+            stop.set()
+            wake.set()
+
+        signal.signal(signal.SIGTERM, on_sigterm)
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: wake.set())
+
+        # Syncs are scheduled from a monotonic deadline so their duration adds no drift
+        next_sync = time.monotonic()
         try:
-            while True:
+            while not stop.is_set():
                 self.full_sync()
-                logger.info(f"Waiting {interval} minutes until next sync...")
-                time.sleep(interval * 60)
+                if stop.is_set():
+                    break
+
+                now = time.monotonic()
+                next_sync = max(next_sync + interval * 60, now)
+                logger.info(f"Waiting {(next_sync - now) / 60:.1f} minutes until next sync...")
+                wake.wait(next_sync - now)
+                if wake.is_set() and not stop.is_set():
+                    logger.info("SIGHUP received, syncing now")
+                    next_sync = time.monotonic()
+                wake.clear()
         except KeyboardInterrupt:
             logger.info("Synchronization stopped by user")
 
+        if stop.is_set():
+            logger.info("Synchronization stopped by SIGTERM")
+
 
 def main():
     """Main function with CLI interface."""
@@ -601,10 +1248,7 @@ def main():
             single_project=args.project
         )
     except Exception as e:
-        logger.error(f"Failed to initialize sync manager: {e}")
-        if args.verbose:
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error(f"Failed to initialize sync manager: {e}", exc_info=args.verbose)
         return 1
 
     # Check if configuration is complete